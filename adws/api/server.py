@@ -15,8 +15,18 @@ Usage:
     # Run with Uvicorn
     uvicorn adws.api.server:app --host 0.0.0.0 --port 8000
 
-    # Run with Gunicorn + Uvicorn workers
-    gunicorn adws.api.server:app -w 4 -k uvicorn.workers.UvicornWorker -b 0.0.0.0:8000
+    # Run with the uvloop event loop and httptools parser (pip install .[api])
+    uvicorn adws.api.server:app --host 0.0.0.0 --port 8000 \
+        --loop uvloop --http httptools --timeout-keep-alive 30
+
+    # Run with Gunicorn + Uvicorn workers, one per core. --preload imports the
+    # app (and the metrics registry) once before forking so workers share it
+    # copy-on-write; heartbeat files live in tmpfs to avoid disk stalls.
+    gunicorn adws.api.server:app -k uvicorn.workers.UvicornWorker \
+        -w "$(nproc)" --preload --worker-tmp-dir /dev/shm -b 0.0.0.0:8000
+
+    Each worker keeps its own /metrics TTL cache and counters; a scrape
+    routed through the load balancer reports whichever worker answers.
 
 Example Health Check Response:
     {
@@ -35,18 +45,32 @@ Example Health Check Response:
     }
 """
 
+import asyncio
+import gzip
+import json
+import logging
 import os
+import random
+import sys
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, AsyncIterator, Dict, Optional
 
-from fastapi import FastAPI, Response
+import anyio.to_thread
+from fastapi import FastAPI, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse, PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from adws.observability.health import (
-    check_health,
     check_liveness,
     check_readiness,
+    get_component_checks,
+    summarize_health,
 )
 from adws.observability.metrics import (
     get_metrics_content_type,
@@ -54,46 +78,213 @@ from adws.observability.metrics import (
 )
 from adws.observability.logging import get_logger
 
+# Use orjson (api extra) for response bodies, fall back to the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = get_logger(__name__)
 
+# Responses below this size are not worth the compression overhead
+_GZIP_MINIMUM_SIZE = 1024
+
+# Client-facing error messages; exception details stay in the logs
+_HEALTH_ERROR = "An internal error has occurred."
+_LIVENESS_ERROR = "An internal error occurred. The application is not alive."
+_READINESS_ERROR = "An internal error occurred. The application is not ready."
+
+# Fraction of handler errors logged with a full traceback
+_EXC_INFO_SAMPLE_RATE = float(os.getenv("ADWS_API_EXC_INFO_SAMPLE_RATE", "0.01"))
+
+# Startup time for uptime calculation
+_startup_time = datetime.now(timezone.utc)
+
+
+def _dumps(content: Any) -> bytes:
+    """Serialize a JSON response body compactly, with orjson when installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(content)
+    return json.dumps(content, separators=(",", ":")).encode("utf-8")
+
+
+def _log_handler_error(event: str, error: Exception) -> str:
+    """Log a handler failure and return the stringified error.
+
+    Tracebacks are only attached to a sample of errors so a degraded
+    component cannot flood the logs with frame formatting on every probe.
+    """
+    message = str(error)
+    logger.error(
+        event,
+        error=message,
+        exc_info=random.random() < _EXC_INFO_SAMPLE_RATE,
+    )
+    return message
+
+
+# (epoch seconds, ISO8601 string) of the last rendered response timestamp
+_cached_ts: tuple[float, str] = (0.0, "")
+
+
+def _now_iso() -> str:
+    """Return the current UTC time as ISO8601, reused within a millisecond."""
+    global _cached_ts
+    now = time.time()
+    cached_at, cached_iso = _cached_ts
+    if 0.0 <= now - cached_at < 0.001:
+        return cached_iso
+    iso = datetime.fromtimestamp(now, timezone.utc).isoformat()
+    _cached_ts = (now, iso)
+    return iso
+
+
+def _opt_path(env_var: str) -> Optional[Path]:
+    """Return the environment variable as a Path, or None if unset/empty."""
+    value = os.getenv(env_var)
+    return Path(value) if value else None
+
+
+# Component paths resolved once; health checks fall back to defaults on None
+_DB_PATH = _opt_path("ADWS_DB_PATH")
+_EVENT_BUS_DIR = _opt_path("ADWS_EVENT_BUS_DIR")
+_WORKSPACE_DIR = _opt_path("ADWS_WORKSPACE_DIR")
+
+
+@dataclass
+class _MetricsCache:
+    """Rendered Prometheus payload reused across scrapes until it expires.
+
+    Attributes:
+        payload: Exposition-format bytes from the last render
+        gzipped: Gzip-compressed copy of ``payload`` (empty if too small)
+        content_type: Content type reported alongside the payload
+        expires_at: ``time.monotonic()`` deadline after which to re-render
+        lock: Serializes re-renders so concurrent scrapes share one render
+    """
+
+    payload: bytes = b""
+    gzipped: bytes = b""
+    content_type: str = ""
+    expires_at: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+_metrics_cache = _MetricsCache()
+_METRICS_CACHE_TTL = float(os.getenv("ADWS_METRICS_CACHE_TTL", "10"))
+
+
+def _render_metrics(cache: _MetricsCache, now: float) -> None:
+    """Re-render the Prometheus payload into the cache."""
+    payload = get_metrics_output()
+    cache.payload = payload
+    cache.gzipped = (
+        gzip.compress(payload) if len(payload) >= _GZIP_MINIMUM_SIZE else b""
+    )
+    cache.content_type = get_metrics_content_type()
+    cache.expires_at = now + _METRICS_CACHE_TTL
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Prepare the server on startup and log shutdown."""
+    # Health probes run blocking checks in worker threads; raise the
+    # default limit of 40 so probe bursts do not queue behind each other.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
+
+    # Prime the metrics cache so the first scrape is served warm
+    _render_metrics(_metrics_cache, time.monotonic())
+
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "adws_api_server_started",
+            port=os.getenv("ADWS_API_PORT", "8000"),
+            host=os.getenv("ADWS_API_HOST", "0.0.0.0"),
+        )
+    yield
+    logger.info("adws_api_server_shutdown")
+
+
+# Interactive docs and the OpenAPI schema are not served in production
+_PRODUCTION = os.getenv("ADWS_ENV") == "production"
+
 # FastAPI app instance
 app = FastAPI(
     title="ADWS Observability API",
     description="Health checks and metrics for AI Developer Workflow System",
     version="2.0.0",
-    docs_url="/docs",
-    redoc_url="/redoc",
-    openapi_url="/openapi.json",
+    docs_url=None if _PRODUCTION else "/docs",
+    redoc_url=None if _PRODUCTION else "/redoc",
+    openapi_url=None if _PRODUCTION else "/openapi.json",
+    lifespan=lifespan,
 )
 
-# Startup time for uptime calculation
-_startup_time = datetime.now(timezone.utc)
+
+async def _liveness_text() -> str:
+    """Run the liveness check and render the /healthz plain-text body."""
+    try:
+        is_alive = await run_in_threadpool(check_liveness)
+        return "OK" if is_alive else "UNHEALTHY"
+    except Exception as e:
+        return f"ERROR: {e}"
 
 
-@app.on_event("startup")
-async def startup_event():
-    """Log startup event."""
-    logger.info(
-        "adws_api_server_started",
-        port=os.getenv("ADWS_API_PORT", "8000"),
-        host=os.getenv("ADWS_API_HOST", "0.0.0.0"),
-    )
+class _HealthzMiddleware:
+    """Pure ASGI middleware answering ``GET /healthz`` before routing.
 
+    Docker polls /healthz every few seconds; serving it here skips FastAPI
+    routing, dependency resolution and response-class handling entirely.
+    """
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Log shutdown event."""
-    logger.info("adws_api_server_shutdown")
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"] == "/healthz"
+            and scope["method"] == "GET"
+        ):
+            body = (await _liveness_text()).encode("utf-8")
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        (b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode("latin-1")),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        await self.app(scope, receive, send)
+
+
+class _GZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes /metrics through untouched.
+
+    /metrics serves its own pre-compressed bodies and sets ``Vary`` on both
+    encodings; Starlette versions differ in whether they add ``Vary`` to
+    uncompressed responses, so the middleware stays out of that route.
+    """
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] == "/metrics":
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
 
-@app.get("/", response_class=JSONResponse)
-async def root() -> Dict[str, Any]:
-    """Root endpoint with API information.
 
-    Returns:
-        API metadata and available endpoints
-    """
-    return {
+app.add_middleware(_GZipMiddleware, minimum_size=_GZIP_MINIMUM_SIZE)
+# Added last so it runs outermost, ahead of compression and routing
+app.add_middleware(_HealthzMiddleware)
+
+# Static payloads serialized once at import time
+_ROOT_BYTES = _dumps(
+    {
         "service": "ADWS Observability API",
         "version": "2.0.0",
         "status": "running",
@@ -103,9 +294,38 @@ async def root() -> Dict[str, Any]:
             "readiness": "/health/readiness",
             "metrics": "/metrics",
             "info": "/info",
-            "docs": "/docs",
+            **({} if _PRODUCTION else {"docs": "/docs"}),
         },
     }
+)
+
+# /info payload minus uptime_seconds, the only per-request value
+_INFO_TEMPLATE: Dict[str, Any] = {
+    "service": "ADWS",
+    "version": "2.0.0",
+    "startup_time": _startup_time.isoformat(),
+    "python_version": sys.version,
+    "environment": {
+        "log_level": os.getenv("ADWS_LOG_LEVEL", "INFO"),
+        "metrics_enabled": os.getenv("ADWS_METRICS_ENABLED", "true"),
+        "health_checks_enabled": os.getenv("ADWS_HEALTH_CHECKS_ENABLED", "true"),
+    },
+    "paths": {
+        "workspace": os.getenv("ADWS_WORKSPACE_DIR", ".adws"),
+        "database": os.getenv("ADWS_DB_PATH", ".adws/state/workflows.db"),
+        "event_bus": os.getenv("ADWS_EVENT_BUS_DIR", ".adws/events"),
+    },
+}
+
+
+@app.get("/", response_class=JSONResponse)
+async def root() -> Response:
+    """Root endpoint with API information.
+
+    Returns:
+        API metadata and available endpoints
+    """
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health", response_class=JSONResponse)
@@ -123,22 +343,16 @@ async def health() -> Dict[str, Any]:
         503: One or more components unhealthy
     """
     try:
-        # Get default paths from environment or use defaults
-        db_path = os.getenv("ADWS_DB_PATH")
-        event_bus_dir = os.getenv("ADWS_EVENT_BUS_DIR")
-        workspace_dir = os.getenv("ADWS_WORKSPACE_DIR")
-
-        # Convert to Path if provided
-        db_path = Path(db_path) if db_path else None
-        event_bus_dir = Path(event_bus_dir) if event_bus_dir else None
-        workspace_dir = Path(workspace_dir) if workspace_dir else None
-
-        # Run health check
-        health_status = check_health(
-            db_path=db_path,
-            event_bus_dir=event_bus_dir,
-            workspace_dir=workspace_dir,
+        # Run component checks concurrently off the event loop
+        checks = get_component_checks(
+            db_path=_DB_PATH,
+            event_bus_dir=_EVENT_BUS_DIR,
+            workspace_dir=_WORKSPACE_DIR,
+        )
+        components = await asyncio.gather(
+            *(run_in_threadpool(check) for check in checks)
         )
+        health_status = summarize_health(list(components))
 
         # Calculate uptime
         uptime = (datetime.now(timezone.utc) - _startup_time).total_seconds()
@@ -156,12 +370,12 @@ async def health() -> Dict[str, Any]:
         )
 
     except Exception as e:
-        logger.error("health_check_error", error=str(e), exc_info=True)
+        _log_handler_error("health_check_error", e)
         return JSONResponse(
             content={
                 "status": "unhealthy",
-                "error": "An internal error has occurred.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "error": _HEALTH_ERROR,
+                "timestamp": _now_iso(),
             },
             status_code=503,
         )
@@ -182,7 +396,7 @@ async def liveness() -> Dict[str, Any]:
         503: Application should be restarted
     """
     try:
-        is_alive = check_liveness()
+        is_alive = await run_in_threadpool(check_liveness)
 
         status_code = 200 if is_alive else 503
         status = "alive" if is_alive else "dead"
@@ -190,18 +404,18 @@ async def liveness() -> Dict[str, Any]:
         return JSONResponse(
             content={
                 "status": status,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
             },
             status_code=status_code,
         )
 
     except Exception as e:
-        logger.error("liveness_check_error", error=str(e), exc_info=True)
+        _log_handler_error("liveness_check_error", e)
         return JSONResponse(
             content={
                 "status": "dead",
-                "error": "An internal error occurred. The application is not alive.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "error": _LIVENESS_ERROR,
+                "timestamp": _now_iso(),
             },
             status_code=503,
         )
@@ -222,17 +436,10 @@ async def readiness() -> Dict[str, Any]:
         503: Not ready (initializing or unhealthy)
     """
     try:
-        # Get default paths from environment or use defaults
-        db_path = os.getenv("ADWS_DB_PATH")
-        event_bus_dir = os.getenv("ADWS_EVENT_BUS_DIR")
-
-        # Convert to Path if provided
-        db_path = Path(db_path) if db_path else None
-        event_bus_dir = Path(event_bus_dir) if event_bus_dir else None
-
-        is_ready = check_readiness(
-            db_path=db_path,
-            event_bus_dir=event_bus_dir,
+        is_ready = await run_in_threadpool(
+            check_readiness,
+            db_path=_DB_PATH,
+            event_bus_dir=_EVENT_BUS_DIR,
         )
 
         status_code = 200 if is_ready else 503
@@ -241,25 +448,43 @@ async def readiness() -> Dict[str, Any]:
         return JSONResponse(
             content={
                 "status": status,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
             },
             status_code=status_code,
         )
 
     except Exception as e:
-        logger.error("readiness_check_error", error=str(e), exc_info=True)
+        _log_handler_error("readiness_check_error", e)
         return JSONResponse(
             content={
                 "status": "not_ready",
-                "error": "An internal error occurred. The application is not ready.",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "error": _READINESS_ERROR,
+                "timestamp": _now_iso(),
             },
             status_code=503,
         )
 
 
+def _cached_metrics_response(cache: _MetricsCache, accepts_gzip: bool) -> Response:
+    """Build a /metrics response from the cache, pre-compressed when possible."""
+    if not cache.gzipped:
+        return Response(content=cache.payload, media_type=cache.content_type)
+    # Both encodings exist for this URL, so shared caches must key on it
+    if accepts_gzip:
+        return Response(
+            content=cache.gzipped,
+            media_type=cache.content_type,
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        content=cache.payload,
+        media_type=cache.content_type,
+        headers={"Vary": "Accept-Encoding"},
+    )
+
+
 @app.get("/metrics", response_class=PlainTextResponse)
-async def metrics() -> Response:
+async def metrics(request: Request) -> Response:
     """Prometheus metrics endpoint.
 
     Returns metrics in Prometheus exposition format for scraping.
@@ -273,29 +498,37 @@ async def metrics() -> Response:
     - adws_llm_tokens_total: Total LLM tokens used
     - adws_health_status: Component health status (1=healthy, 0=unhealthy)
 
+    The rendered output is cached for ``ADWS_METRICS_CACHE_TTL`` seconds
+    (default 10) so scrapes within the window skip re-serialization. A
+    gzipped copy is cached alongside it for clients that accept gzip.
+
     Returns:
         Plain text response in Prometheus format
     """
+    cache = _metrics_cache
+    accepts_gzip = "gzip" in request.headers.get("accept-encoding", "")
+    if cache.expires_at > time.monotonic():
+        return _cached_metrics_response(cache, accepts_gzip)
+
     try:
-        metrics_output = get_metrics_output()
-        content_type = get_metrics_content_type()
+        async with cache.lock:
+            now = time.monotonic()
+            if cache.expires_at <= now:
+                _render_metrics(cache, now)
 
-        return Response(
-            content=metrics_output,
-            media_type=content_type,
-        )
+        return _cached_metrics_response(cache, accepts_gzip)
 
     except Exception as e:
-        logger.error("metrics_export_error", error=str(e), exc_info=True)
+        message = _log_handler_error("metrics_export_error", e)
         return Response(
-            content=f"# Error exporting metrics: {e}\n",
+            content=f"# Error exporting metrics: {message}\n".encode("utf-8"),
             media_type="text/plain",
             status_code=500,
         )
 
 
 @app.get("/info", response_class=JSONResponse)
-async def info() -> Dict[str, Any]:
+async def info() -> Response:
     """System information endpoint.
 
     Returns general system information and configuration details.
@@ -305,23 +538,10 @@ async def info() -> Dict[str, Any]:
     """
     uptime = (datetime.now(timezone.utc) - _startup_time).total_seconds()
 
-    return {
-        "service": "ADWS",
-        "version": "2.0.0",
-        "uptime_seconds": uptime,
-        "startup_time": _startup_time.isoformat(),
-        "python_version": os.sys.version,
-        "environment": {
-            "log_level": os.getenv("ADWS_LOG_LEVEL", "INFO"),
-            "metrics_enabled": os.getenv("ADWS_METRICS_ENABLED", "true"),
-            "health_checks_enabled": os.getenv("ADWS_HEALTH_CHECKS_ENABLED", "true"),
-        },
-        "paths": {
-            "workspace": os.getenv("ADWS_WORKSPACE_DIR", ".adws"),
-            "database": os.getenv("ADWS_DB_PATH", ".adws/state/workflows.db"),
-            "event_bus": os.getenv("ADWS_EVENT_BUS_DIR", ".adws/events"),
-        },
-    }
+    return Response(
+        content=_dumps(_INFO_TEMPLATE | {"uptime_seconds": uptime}),
+        media_type="application/json",
+    )
 
 
 # Health check for Docker HEALTHCHECK instruction
@@ -329,11 +549,10 @@ async def info() -> Dict[str, Any]:
 async def healthz() -> str:
     """Simple health check for Docker HEALTHCHECK.
 
+    GET requests are answered by ``_HealthzMiddleware`` before routing;
+    the route remains registered for the OpenAPI schema.
+
     Returns:
         "OK" if healthy, error message otherwise
     """
-    try:
-        is_alive = check_liveness()
-        return "OK" if is_alive else "UNHEALTHY"
-    except Exception as e:
-        return f"ERROR: {e}"
+    return await _liveness_text()
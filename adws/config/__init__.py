@@ -13,12 +13,14 @@ precedence:
 
 from __future__ import annotations
 
+import functools
+import mmap
 import os
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Annotated, Any, Dict, Optional
 
 import tomllib
-from pydantic import BaseModel, Field, ConfigDict, field_validator
+from pydantic import BaseModel, BeforeValidator, Field, ConfigDict
 
 from adws.consensus.engine import ConsensusStrategy
 from adws.providers.interfaces import ProviderConfig
@@ -31,6 +33,7 @@ __all__ = [
     "TDDConfig",
     "TUIConfig",
     "load_config",
+    "reload_config",
 ]
 
 
@@ -38,23 +41,45 @@ DEFAULT_STATE_DIR = Path(".adws/state")
 DEFAULT_SQLITE_DB = DEFAULT_STATE_DIR / "workflows.db"
 DEFAULT_EVENT_FILE = Path(".adws/events/events.jsonl")
 
+# Config files above this size are read through a memory map
+_MMAP_MIN_BYTES = 4096
+
+_TRUE_VALUES = frozenset({"1", "true", "yes", "on"})
+_FALSE_VALUES = frozenset({"0", "false", "no", "off"})
+
+_STRATEGY_BY_NAME: Dict[str, ConsensusStrategy] = {
+    strategy.value: strategy for strategy in ConsensusStrategy
+}
+
 
 class ConfigError(RuntimeError):
     """Raised when configuration cannot be loaded or validated."""
 
 
+def _coerce_path(value: Any) -> Path:
+    """Convert raw string values to Path, passing Path instances through."""
+
+    return value if isinstance(value, Path) else Path(value)
+
+
+# Path field that also accepts plain strings from TOML/env values
+_CoercedPath = Annotated[Path, BeforeValidator(_coerce_path)]
+
+_MODEL_CONFIG = ConfigDict(
+    frozen=True,
+    arbitrary_types_allowed=True,
+    extra="ignore",
+    validate_assignment=False,
+)
+
+
 class EventConfig(BaseModel):
     """Event streaming configuration."""
 
     backend: str = Field("file", description="Event backend type")
-    file: Path = Field(DEFAULT_EVENT_FILE, description="Path to event log file")
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    file: _CoercedPath = Field(DEFAULT_EVENT_FILE, description="Path to event log file")
 
-    @field_validator("file", mode="before")
-    @classmethod
-    def _coerce_path(cls, value: Any) -> Path:
-        return Path(value) if not isinstance(value, Path) else value
+    model_config = _MODEL_CONFIG
 
 
 class TUIConfig(BaseModel):
@@ -63,6 +88,8 @@ class TUIConfig(BaseModel):
     enabled: bool = Field(True, description="Whether the TUI is enabled")
     refresh_ms: int = Field(100, description="Refresh interval for UI updates", ge=16)
 
+    model_config = _MODEL_CONFIG
+
 
 class TDDConfig(BaseModel):
     """Configuration for the TDD workflow helpers."""
@@ -80,6 +107,8 @@ class TDDConfig(BaseModel):
         min_length=1,
     )
 
+    model_config = _MODEL_CONFIG
+
 
 def _default_cleanup_policy() -> CleanupPolicy:
     """Provide a sensible default cleanup policy."""
@@ -105,23 +134,18 @@ class ADWSConfig(BaseModel):
         ConsensusStrategy.MAJORITY_VOTE,
         description="Consensus strategy for multi-provider execution",
     )
-    state_dir: Path = Field(DEFAULT_STATE_DIR, description="State directory path")
-    sqlite_db: Path = Field(DEFAULT_SQLITE_DB, description="SQLite database path")
+    state_dir: _CoercedPath = Field(DEFAULT_STATE_DIR, description="State directory path")
+    sqlite_db: _CoercedPath = Field(DEFAULT_SQLITE_DB, description="SQLite database path")
     cleanup_policy: CleanupPolicy = Field(
         default_factory=_default_cleanup_policy,
         description="System-wide cleanup policy defaults",
     )
     event_backend: str = Field("file", description="Event backend identifier")
-    event_file: Path = Field(DEFAULT_EVENT_FILE, description="Event log path")
+    event_file: _CoercedPath = Field(DEFAULT_EVENT_FILE, description="Event log path")
     tdd: TDDConfig = Field(default_factory=TDDConfig)
     tui: TUIConfig = Field(default_factory=TUIConfig)
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
-
-    @field_validator("state_dir", "sqlite_db", "event_file", mode="before")
-    @classmethod
-    def _coerce_path(cls, value: Any) -> Path:
-        return Path(value) if not isinstance(value, Path) else value
+    model_config = _MODEL_CONFIG
 
     @property
     def tui_config(self) -> TUIConfig:
@@ -154,10 +178,30 @@ class ADWSConfig(BaseModel):
         return self.tdd.test_framework
 
 
+# Environment variables consulted by load_config
+_ADWS_ENV_KEYS = (
+    "ADWS_DEFAULT_PROVIDER",
+    "ADWS_CONSENSUS_STRATEGY",
+    "ADWS_STATE_DIR",
+    "ADWS_SQLITE_DB",
+    "ADWS_EVENT_BACKEND",
+    "ADWS_EVENT_FILE",
+    "ADWS_TDD_ENABLED",
+    "ADWS_TDD_COVERAGE_TARGET",
+    "ADWS_TEST_FRAMEWORK",
+    "ADWS_TUI_ENABLED",
+    "ADWS_TUI_REFRESH_MS",
+)
+
+
+@functools.lru_cache(maxsize=8)
 def load_config(config_path: Optional[Path | str] = None) -> ADWSConfig:
     """
     Load ADWS configuration from file/environment/defaults.
 
+    Results are cached per `config_path` for the lifetime of the process;
+    call `reload_config` to pick up file or environment changes.
+
     Args:
         config_path: Optional explicit path to an `adws.toml` file.
 
@@ -168,7 +212,20 @@ def load_config(config_path: Optional[Path | str] = None) -> ADWSConfig:
         ConfigError: if the provided config path does not exist or parsing fails.
     """
 
-    raw_data = _load_toml_data(config_path)
+    resolved_path = _resolve_config_path(config_path)
+    if resolved_path is None and not any(
+        os.getenv(env_var) is not None for env_var in _ADWS_ENV_KEYS
+    ):
+        # A fresh instance per cache fill, so reload_config() recovers from
+        # callers mutating a cached config's (mutable) providers dict
+        return ADWSConfig()
+
+    raw_data = _load_toml_data(resolved_path)
+    state_cfg = raw_data.get("state") or {}
+    event_cfg = raw_data.get("event") or {}
+    tdd_data = raw_data.get("tdd") or {}
+    tui_data = raw_data.get("tui") or {}
+
     providers = _load_provider_configs(raw_data.get("providers", {}))
 
     default_provider = _env_or_value(
@@ -188,32 +245,31 @@ def load_config(config_path: Optional[Path | str] = None) -> ADWSConfig:
     state_dir = Path(
         _env_or_value(
             "ADWS_STATE_DIR",
-            raw_data.get("state", {}).get("state_dir") if raw_data.get("state") else None,
+            state_cfg.get("state_dir"),
             str(DEFAULT_STATE_DIR),
         )
     )
     sqlite_db = Path(
         _env_or_value(
             "ADWS_SQLITE_DB",
-            raw_data.get("state", {}).get("sqlite_db") if raw_data.get("state") else None,
+            state_cfg.get("sqlite_db"),
             str(DEFAULT_SQLITE_DB),
         )
     )
 
     event_backend = _env_or_value(
         "ADWS_EVENT_BACKEND",
-        raw_data.get("event", {}).get("backend") if raw_data.get("event") else None,
+        event_cfg.get("backend"),
         "file",
     )
     event_file = Path(
         _env_or_value(
             "ADWS_EVENT_FILE",
-            raw_data.get("event", {}).get("file") if raw_data.get("event") else None,
+            event_cfg.get("file"),
             str(DEFAULT_EVENT_FILE),
         )
     )
 
-    tdd_data = raw_data.get("tdd", {})
     tdd_enabled = _env_bool(
         "ADWS_TDD_ENABLED", tdd_data.get("enabled", True)
     )
@@ -230,7 +286,6 @@ def load_config(config_path: Optional[Path | str] = None) -> ADWSConfig:
         TDDConfig().test_framework,
     )
 
-    tui_data = raw_data.get("tui", {})
     tui_enabled = _env_bool(
         "ADWS_TUI_ENABLED", tui_data.get("enabled", True)
     )
@@ -265,10 +320,27 @@ def load_config(config_path: Optional[Path | str] = None) -> ADWSConfig:
     )
 
 
-def _load_toml_data(config_path: Optional[Path | str]) -> Dict[str, Any]:
-    """Load data from a TOML file if one can be resolved."""
+def reload_config(config_path: Optional[Path | str] = None) -> ADWSConfig:
+    """
+    Discard cached configuration and load it again.
+
+    Intended for reload hooks (e.g. a SIGHUP handler) and tests that change
+    environment variables between loads.
+
+    Args:
+        config_path: Optional explicit path to an `adws.toml` file.
+
+    Returns:
+        Freshly loaded ADWSConfig.
+    """
+
+    load_config.cache_clear()
+    return load_config(config_path)
+
+
+def _load_toml_data(resolved: Optional[Path]) -> Dict[str, Any]:
+    """Load data from the resolved TOML file, if there is one."""
 
-    resolved = _resolve_config_path(config_path)
     if resolved is None:
         return {}
 
@@ -276,7 +348,10 @@ def _load_toml_data(config_path: Optional[Path | str]) -> Dict[str, Any]:
         raise ConfigError(f"Configuration file not found: {resolved}")
 
     with resolved.open("rb") as fh:
-        return tomllib.load(fh)
+        if os.fstat(fh.fileno()).st_size <= _MMAP_MIN_BYTES:
+            return tomllib.load(fh)
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return tomllib.loads(mapped[:].decode("utf-8"))
 
 
 def _resolve_config_path(config_path: Optional[Path | str]) -> Optional[Path]:
@@ -310,11 +385,10 @@ def _load_provider_configs(raw: Dict[str, Any]) -> Dict[str, ProviderConfig]:
 def _parse_consensus_strategy(raw_value: str) -> ConsensusStrategy:
     """Convert string to ConsensusStrategy, allowing hyphen/underscore aliases."""
 
-    normalized = raw_value.replace("_", "-").lower()
-    for strategy in ConsensusStrategy:
-        if strategy.value == normalized:
-            return strategy
-    raise ConfigError(f"Unknown consensus strategy: {raw_value}")
+    strategy = _STRATEGY_BY_NAME.get(raw_value.replace("_", "-").lower())
+    if strategy is None:
+        raise ConfigError(f"Unknown consensus strategy: {raw_value}")
+    return strategy
 
 
 def _env_bool(env_var: str, default: Any) -> bool:
@@ -324,9 +398,9 @@ def _env_bool(env_var: str, default: Any) -> bool:
     if value is None:
         return bool(default)
     normalized = value.strip().lower()
-    if normalized in {"1", "true", "yes", "on"}:
+    if normalized in _TRUE_VALUES:
         return True
-    if normalized in {"0", "false", "no", "off"}:
+    if normalized in _FALSE_VALUES:
         return False
     raise ConfigError(f"Invalid boolean for {env_var}: {value}")
 
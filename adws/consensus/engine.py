@@ -6,8 +6,12 @@ LLM providers for improved quality and reliability.
 """
 
 import asyncio
+import hashlib
+import math
+import time
+from collections import OrderedDict
 from datetime import datetime, UTC
-from typing import List, Optional, Dict, Callable
+from typing import List, Literal, Optional, Dict, Callable, Tuple
 from enum import Enum
 from pydantic import BaseModel, Field
 
@@ -21,6 +25,62 @@ try:
 except ImportError:
     RAPIDFUZZ_AVAILABLE = False
 
+# numpy backs both optional fast paths below (consensus-fast extra)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Batched similarity matrices need rapidfuzz.process.cdist, which returns numpy arrays
+try:
+    from rapidfuzz import process as rapidfuzz_process
+    CDIST_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    CDIST_AVAILABLE = False
+
+# Compiled DP for the no-rapidfuzz path when numba is installed
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _levenshtein_numba(source, target):
+        """Two-row Levenshtein DP over UTF-32 code point arrays."""
+        n = target.shape[0]
+        previous = np.arange(n + 1, dtype=np.int64)
+        current = np.empty(n + 1, dtype=np.int64)
+        for i in range(source.shape[0]):
+            current[0] = i + 1
+            char = source[i]
+            for j in range(n):
+                cost = 0 if char == target[j] else 1
+                best = previous[j] + cost
+                if previous[j + 1] + 1 < best:
+                    best = previous[j + 1] + 1
+                if current[j] + 1 < best:
+                    best = current[j] + 1
+                current[j + 1] = best
+            previous, current = current, previous
+        return previous[n]
+
+    def _code_points(text: str) -> "np.ndarray":
+        """View a string as a uint32 array of code points for the numba kernel."""
+        return np.frombuffer(text.encode("utf-32-le"), dtype=np.uint32)
+
+
+# Rough characters-compared estimate above which cdist spreads rows over all
+# cores; below it thread start-up costs more than the comparisons themselves
+_CDIST_PARALLEL_MIN_WORK = 1_000_000
+
+# How far Sift4 looks ahead for a matching character after a mismatch
+_SIFT4_MAX_OFFSET = 5
+
+SimilarityAlgorithm = Literal["levenshtein", "sift4"]
+
 
 class ConsensusStrategy(str, Enum):
     """
@@ -52,6 +112,8 @@ class ConsensusConfig(BaseModel):
         max_attempts: Maximum consensus attempts
         timeout: Timeout per provider in seconds
         similarity_threshold: Similarity threshold for grouping (default 0.8)
+        similarity_algorithm: "levenshtein" (exact, default) or "sift4"
+            (approximate, much faster on long outputs)
         provider_weights: Weights for weighted average (optional)
 
     Example:
@@ -96,6 +158,10 @@ class ConsensusConfig(BaseModel):
         ge=0.0,
         le=1.0
     )
+    similarity_algorithm: SimilarityAlgorithm = Field(
+        default="levenshtein",
+        description="Similarity measure used for grouping"
+    )
     provider_weights: Optional[Dict[str, float]] = Field(
         None,
         description="Provider weights for weighted average"
@@ -281,7 +347,9 @@ class ConsensusEngine:
     def __init__(
         self,
         registry: ProviderRegistry,
-        scoring_config: Optional[ConsensusScoringConfig] = None
+        scoring_config: Optional[ConsensusScoringConfig] = None,
+        cache_size: int = 0,
+        cache_ttl: Optional[float] = None
     ):
         """
         Initialize consensus engine.
@@ -289,9 +357,69 @@ class ConsensusEngine:
         Args:
             registry: Provider registry for provider lookup
             scoring_config: Optional scoring configuration (uses default if None)
+            cache_size: Number of consensus results to keep in an LRU cache
+                keyed by (request, config); 0 disables caching (default)
+            cache_ttl: Seconds a cached result stays valid (None = no expiry)
         """
         self._registry = registry
+        # digest -> (monotonic insert time, result), least recently used first
+        self._result_cache: "OrderedDict[bytes, Tuple[float, ConsensusResult]]" = OrderedDict()
         self.scoring_config = scoring_config if scoring_config is not None else ConsensusScoringConfig()
+        # Per-run score memo keyed by id(); the response is kept alongside
+        # the score so a recycled id can never return a stale value
+        self._score_cache: Dict[int, Tuple[PromptResponse, float]] = {}
+        self._cache_size = max(0, cache_size)
+        self._cache_ttl = cache_ttl
+
+    @property
+    def scoring_config(self) -> ConsensusScoringConfig:
+        """
+        Scoring configuration used by the engine.
+
+        Assigning a new configuration rebuilds the specialized scorer and
+        drops cached results. Mutating the current object in place has the
+        same effect, picked up at the start of the next consensus run.
+        """
+        return self._scoring_config
+
+    @scoring_config.setter
+    def scoring_config(self, config: ConsensusScoringConfig) -> None:
+        self._scoring_config = config
+        self._scoring_fingerprint = tuple(config.__dict__.values())
+        self._scorer = self._build_scorer(config)
+        # Cached results were selected with the previous scoring
+        self._result_cache.clear()
+
+    def _refresh_scoring(self) -> None:
+        """Rebuild the scorer if the scoring config was mutated in place."""
+        config = self._scoring_config
+        if tuple(config.__dict__.values()) != self._scoring_fingerprint:
+            self.scoring_config = config
+
+    def invalidate(self) -> None:
+        """Drop every cached consensus result."""
+        self._result_cache.clear()
+
+    def _result_cache_key(
+        self,
+        request: PromptRequest,
+        config: ConsensusConfig
+    ) -> Optional[bytes]:
+        """
+        Digest a (request, config) pair for the result cache.
+
+        The full request is hashed, not just the prompt, since any field
+        (messages, temperature, tools, ...) can change provider output.
+
+        Returns:
+            Digest bytes, or None if the request cannot be serialized
+        """
+        try:
+            payload = request.model_dump_json() + config.model_dump_json()
+        except ValueError:
+            # Arbitrary metadata values may not be JSON serializable
+            return None
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).digest()
 
     async def get_consensus_async(
         self,
@@ -320,18 +448,41 @@ class ConsensusEngine:
             >>> if result.success:
             ...     print(f"Consensus: {result.response.output}")
         """
+        self._refresh_scoring()
+
+        cache_key = None
+        if self._cache_size:
+            cache_key = self._result_cache_key(request, config)
+            cached = self._result_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                inserted_at, cached_result = cached
+                if self._cache_ttl is None or time.monotonic() - inserted_at < self._cache_ttl:
+                    self._result_cache.move_to_end(cache_key)
+                    return cached_result
+                del self._result_cache[cache_key]
+
         # Execute across all providers in parallel
         provider_responses = await self._execute_multi_provider_async(
             request,
             config.providers,
-            config.timeout
+            config.timeout,
+            stop_on_failure=config.strategy == ConsensusStrategy.ALL_AGREE
         )
 
         if not provider_responses:
             raise RuntimeError("All providers failed to respond")
 
         # Apply consensus strategy
-        result = self._apply_consensus(provider_responses, config)
+        try:
+            result = self._apply_consensus(provider_responses, config)
+        finally:
+            self._score_cache.clear()
+
+        if cache_key is not None:
+            self._result_cache[cache_key] = (time.monotonic(), result)
+            self._result_cache.move_to_end(cache_key)
+            if len(self._result_cache) > self._cache_size:
+                self._result_cache.popitem(last=False)
 
         return result
 
@@ -357,103 +508,178 @@ class ConsensusEngine:
         """
         return asyncio.run(self.get_consensus_async(request, config))
 
+    async def batch_consensus_async(
+        self,
+        requests: List[PromptRequest],
+        config: ConsensusConfig,
+        max_workers: int = 8
+    ) -> List[ConsensusResult]:
+        """
+        Get consensus for many requests concurrently (asynchronous).
+
+        Runs get_consensus_async for each request, with at most
+        `max_workers` requests in flight at once so a large batch does not
+        open an unbounded number of provider calls.
+
+        Args:
+            requests: Prompt requests to execute
+            config: Consensus configuration shared by every request
+            max_workers: Maximum number of requests executed concurrently
+
+        Returns:
+            Consensus results in the same order as `requests`
+
+        Raises:
+            ValueError: If max_workers is not positive, or a request's
+                consensus threshold is not met
+            RuntimeError: If all providers fail for a request
+
+        Example:
+            >>> results = await engine.batch_consensus_async(requests, config)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_workers)
+
+        async def run(request: PromptRequest) -> ConsensusResult:
+            async with semaphore:
+                return await self.get_consensus_async(request, config)
+
+        return list(await asyncio.gather(*(run(request) for request in requests)))
+
     async def _execute_multi_provider_async(
         self,
         request: PromptRequest,
         provider_ids: List[str],
-        timeout: float
+        timeout: float,
+        stop_on_failure: bool = False
     ) -> List[ProviderResponse]:
         """
         Execute request across multiple providers in parallel.
 
+        All providers share a single deadline `timeout` seconds from now;
+        providers still running at the deadline are cancelled and contribute
+        no response.
+
+        Args:
+            request: Prompt request to execute
+            provider_ids: Provider IDs to query
+            timeout: Seconds until the shared deadline
+            stop_on_failure: Cancel the remaining providers and raise as soon
+                as one fails or misses the deadline (used by ALL_AGREE, where
+                a single failure already decides the outcome)
+
         Returns:
-            List of provider responses
+            Successful provider responses, in provider order
+
+        Raises:
+            ValueError: If stop_on_failure is set and a provider fails
         """
-        tasks = []
+        tasks: List[asyncio.Task] = []
 
         for provider_id in provider_ids:
             provider = self._registry.get(provider_id)
             if not provider:
                 continue
 
-            task = self._execute_provider_with_timeout(
-                provider,
-                provider_id,
-                request,
-                timeout
-            )
-            tasks.append(task)
+            tasks.append(asyncio.ensure_future(
+                self._execute_provider(provider, provider_id, request)
+            ))
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        pending = set(tasks)
 
-        # Execute all in parallel
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        try:
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if stop_on_failure and any(
+                    not task.result().response.success for task in done
+                ):
+                    raise ValueError(
+                        "All providers did not agree: at least one provider failed"
+                    )
+
+            if stop_on_failure and pending:
+                raise ValueError(
+                    f"All providers did not agree: provider timeout after {timeout}s"
+                )
+        finally:
+            # Providers past the deadline (or made moot by a failure) are dropped
+            for task in pending:
+                task.cancel()
 
-        # Collect all provider responses (successful or failed)
+        # Collect successful provider responses
         collected_responses: List[ProviderResponse] = []
-        for result in results:
-            if isinstance(result, ProviderResponse) and result.response.success:
-                collected_responses.append(result)
+        for task in tasks:
+            if task.done() and not task.cancelled():
+                result = task.result()
+                if result.response.success:
+                    collected_responses.append(result)
 
         return collected_responses
 
-    async def _execute_provider_with_timeout(
+    async def _execute_provider(
         self,
         provider: LLMProvider,
         provider_id: str,
-        request: PromptRequest,
-        timeout: float
+        request: PromptRequest
     ) -> ProviderResponse:
-        """Execute provider request with timeout."""
+        """Execute provider request, converting errors into a failed response."""
         try:
-            response = await asyncio.wait_for(
-                provider.execute_async(request),
-                timeout=timeout
-            )
+            response = await provider.execute_async(request)
 
             return ProviderResponse(
                 provider_id=provider_id,
                 response=response
             )
 
-        except asyncio.TimeoutError:
-            # Create timeout response
-            return ProviderResponse(
-                provider_id=provider_id,
-                response=PromptResponse(
-                    output="",
-                    success=False,
-                    provider=provider_id,
-                    model=request.model,
-                    input_tokens=0,
-                    output_tokens=0,
-                    total_tokens=0,
-                    cost_usd=0.0,
-                    duration_seconds=timeout,
-                    timestamp=datetime.now(UTC),
-                    retry_code=RetryCode.TIMEOUT_ERROR,
-                    error_message=f"Consensus timeout after {timeout}s"
-                )
-            )
-
         except Exception as e:
             # Create error response
-            return ProviderResponse(
-                provider_id=provider_id,
-                response=PromptResponse(
-                    output="",
-                    success=False,
-                    provider=provider_id,
-                    model=request.model,
-                    input_tokens=0,
-                    output_tokens=0,
-                    total_tokens=0,
-                    cost_usd=0.0,
-                    duration_seconds=0.0,
-                    timestamp=datetime.now(UTC),
-                    retry_code=RetryCode.EXECUTION_ERROR,
-                    error_message=str(e)
-                )
+            return self._failed_provider_response(
+                provider_id,
+                request,
+                duration_seconds=0.0,
+                retry_code=RetryCode.EXECUTION_ERROR,
+                error_message=str(e)
             )
 
+    def _failed_provider_response(
+        self,
+        provider_id: str,
+        request: PromptRequest,
+        duration_seconds: float,
+        retry_code: RetryCode,
+        error_message: str
+    ) -> ProviderResponse:
+        """Build the empty, unsuccessful response recorded for a failed provider."""
+        return ProviderResponse(
+            provider_id=provider_id,
+            response=PromptResponse(
+                output="",
+                success=False,
+                provider=provider_id,
+                model=request.model,
+                input_tokens=0,
+                output_tokens=0,
+                total_tokens=0,
+                cost_usd=0.0,
+                duration_seconds=duration_seconds,
+                timestamp=datetime.now(UTC),
+                retry_code=retry_code,
+                error_message=error_message
+            )
+        )
+
     def _apply_consensus(
         self,
         responses: List[ProviderResponse],
@@ -493,10 +719,19 @@ class ConsensusEngine:
         if not successful_responses:
             raise ValueError("Consensus not reached: no successful provider responses")
 
+        # A group holding a strict majority of providers that also meets the
+        # threshold must be the largest, so grouping can stop once one exists
+        required = max(
+            math.ceil(config.threshold * total_providers),
+            total_providers // 2 + 1
+        )
+
         # Group similar responses across successful providers
         groups = self._group_similar_responses(
             successful_responses,
-            config.similarity_threshold
+            config.similarity_threshold,
+            config.similarity_algorithm,
+            stop_at=required
         )
 
         if not groups:
@@ -517,8 +752,7 @@ class ConsensusEngine:
         selected = largest_group[0]
 
         # Calculate total cost and latency
-        total_cost = sum(r.response.cost_usd for r in responses)
-        total_latency = sum(r.response.duration_seconds for r in responses)
+        total_cost, total_latency, _ = self._totals(responses)
 
         return ConsensusResult(
             response=selected.response,
@@ -538,32 +772,24 @@ class ConsensusEngine:
         """
         Best-of-N consensus.
 
-        Scores each response for quality and selects the highest.
-        """
-        # Score each response
-        scored_responses = []
-        for pr in responses:
-            score = self._score_response(pr.response)
-            scored_responses.append(
-                ProviderResponse(
-                    provider_id=pr.provider_id,
-                    response=pr.response,
-                    score=score
-                )
-            )
-
-        # Sort by score (highest first)
-        scored_responses.sort(key=lambda x: x.score or 0, reverse=True)
+        Scores each response for quality and selects the highest. Responses
+        are returned in provider order with their scores attached; ties go
+        to the earliest provider.
+        """
+        # Score each response (model_copy skips re-validating the nested response)
+        scored_responses = [
+            pr.model_copy(update={"score": self._score_response(pr.response)})
+            for pr in responses
+        ]
 
-        # Select best
-        best = scored_responses[0]
+        # Select best in one linear pass (max keeps the first of equal scores)
+        best = max(scored_responses, key=lambda x: x.score or 0)
         agreement = ((best.score or 0.0) / 100.0)
         # Clamp agreement to [0.0, 1.0] range to prevent validation errors
         agreement = max(0.0, min(1.0, agreement))
 
         # Calculate total cost and latency
-        total_cost = sum(r.response.cost_usd for r in responses)
-        total_latency = sum(r.response.duration_seconds for r in responses)
+        total_cost, total_latency, _ = self._totals(responses)
 
         return ConsensusResult(
             response=best.response,
@@ -599,11 +825,7 @@ class ConsensusEngine:
             weighted_candidates = []
             for pr in responses:
                 base_score = self._score_response(pr.response)
-                provider_response = ProviderResponse(
-                    provider_id=pr.provider_id,
-                    response=pr.response,
-                    score=base_score
-                )
+                provider_response = pr.model_copy(update={"score": base_score})
 
                 weight = weights.get(pr.provider_id, 1.0)
                 normalized_weight = weight / max_weight if max_weight else 1.0
@@ -622,8 +844,7 @@ class ConsensusEngine:
             agreement = max(0.0, min(1.0, agreement))
 
             # Calculate total cost and latency
-            total_cost = sum(r.response.cost_usd for r in responses)
-            total_latency = sum(r.response.duration_seconds for r in responses)
+            total_cost, total_latency, _ = self._totals(responses)
 
             return ConsensusResult(
                 response=best.response,
@@ -646,34 +867,37 @@ class ConsensusEngine:
         """
         All-agree consensus.
 
-        Requires all providers to produce similar responses.
-        Strictest consensus strategy.
+        Requires all providers to produce responses similar to the first
+        provider's. Strictest consensus strategy.
         """
         total_providers = len(responses)
         if total_providers == 0:
             raise ValueError("No provider responses available for consensus")
 
-        if any(not pr.response.success for pr in responses):
+        total_cost, total_latency, all_succeeded = self._totals(responses)
+        if not all_succeeded:
             raise ValueError("All providers did not agree: at least one provider failed")
 
-        # Group similar responses
-        groups = self._group_similar_responses(
-            responses,
-            config.similarity_threshold
-        )
-
-        if len(groups) != 1 or len(groups[0]) != total_providers:
-            raise ValueError(
-                f"All providers did not agree: {len(groups)} different response groups"
+        # Identical outputs agree trivially; str hashes are cached on the
+        # string objects, so this check never rescans an output twice
+        outputs = list(dict.fromkeys(pr.response.output for pr in responses))
+        if len(outputs) > 1:
+            # Every output must match the first; compare lazily so the first
+            # mismatch aborts without scoring the remaining pairs
+            is_similar = self._similarity_lookup(
+                outputs,
+                config.similarity_threshold,
+                config.similarity_algorithm,
+                batched=False
             )
+            if not all(is_similar(0, index) for index in range(1, len(outputs))):
+                raise ValueError(
+                    "All providers did not agree: a response differs from the first provider's"
+                )
 
         # All responses are similar - use first
         selected = responses[0]
 
-        # Calculate total cost and latency
-        total_cost = sum(r.response.cost_usd for r in responses)
-        total_latency = sum(r.response.duration_seconds for r in responses)
-
         return ConsensusResult(
             response=selected.response,
             agreement=1.0,
@@ -684,39 +908,162 @@ class ConsensusEngine:
             success=True
         )
 
+    def _totals(
+        self,
+        responses: List[ProviderResponse]
+    ) -> Tuple[float, float, bool]:
+        """
+        Sum cost and latency across responses in a single pass.
+
+        Returns:
+            Tuple of (total cost, total latency, whether every response succeeded)
+        """
+        total_cost = 0.0
+        total_latency = 0.0
+        all_succeeded = True
+        for provider_response in responses:
+            response = provider_response.response
+            total_cost += response.cost_usd
+            total_latency += response.duration_seconds
+            if not response.success:
+                all_succeeded = False
+        return total_cost, total_latency, all_succeeded
+
     def _group_similar_responses(
         self,
         responses: List[ProviderResponse],
-        threshold: float
+        threshold: float,
+        algorithm: SimilarityAlgorithm = "levenshtein",
+        stop_at: Optional[int] = None
     ) -> List[List[ProviderResponse]]:
         """
         Group similar responses using similarity threshold.
 
+        Responses are linked whenever a pair meets the threshold and groups are
+        the connected components (union-find), so grouping does not depend on
+        response order. Groups are ordered by their first member, and members
+        keep their original order.
+
+        Byte-identical outputs are collapsed first, so similarity is only
+        computed between unique outputs.
+
+        Args:
+            responses: Responses to group
+            threshold: Similarity threshold (0.0-1.0)
+            algorithm: Similarity measure ("levenshtein" or "sift4")
+            stop_at: Stop pairwise comparison once a group holds this many
+                responses. That group is still completed exactly, but the
+                remaining groups may be left split.
+
         Returns:
             List of groups, where each group contains similar responses
         """
-        groups: List[List[ProviderResponse]] = []
+        # Map each distinct output to its position among the unique outputs
+        unique_index: Dict[str, int] = {}
+        output_indices = [
+            unique_index.setdefault(r.response.output, len(unique_index))
+            for r in responses
+        ]
+        outputs = list(unique_index)
+        is_similar = self._similarity_lookup(outputs, threshold, algorithm)
+        count = len(outputs)
+        parent = list(range(count))
+        # Number of responses in each component, tracked at the root
+        size = [0] * count
+        for index in output_indices:
+            size[index] += 1
+
+        def find(index: int) -> int:
+            while parent[index] != index:
+                # Path halving keeps the trees shallow
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        def union(root_a: int, root_b: int) -> int:
+            root, child = min(root_a, root_b), max(root_a, root_b)
+            parent[child] = root
+            size[root] += size[child]
+            return root
+
+        def complete(root: int) -> None:
+            # Breadth-first closure of one component over the unvisited outputs
+            frontier = [k for k in range(count) if find(k) == root]
+            outside = [k for k in range(count) if find(k) != root]
+            while frontier and outside:
+                joined = [
+                    k for k in outside
+                    if any(is_similar(min(k, m), max(k, m)) for m in frontier)
+                ]
+                for k in joined:
+                    union(find(root), find(k))
+                outside = [k for k in outside if k not in joined]
+                frontier = joined
+
+        def link_all() -> None:
+            for i in range(count):
+                for j in range(i + 1, count):
+                    root_i, root_j = find(i), find(j)
+                    # Pairs already in the same component need no comparison
+                    if root_i != root_j and is_similar(i, j):
+                        root = union(root_i, root_j)
+                        if stop_at is not None and size[root] >= stop_at:
+                            complete(root)
+                            return
+
+        if stop_at is not None and count and max(size) >= stop_at:
+            complete(size.index(max(size)))
+        else:
+            link_all()
 
-        for response in responses:
-            # Try to find matching group
-            found_group = False
+        groups: Dict[int, List[ProviderResponse]] = {}
+        for index, response in zip(output_indices, responses):
+            groups.setdefault(find(index), []).append(response)
 
-            for group in groups:
-                # Compare with first response in group
-                if self._are_similar(
-                    response.response.output,
-                    group[0].response.output,
-                    threshold
-                ):
-                    group.append(response)
-                    found_group = True
-                    break
+        return list(groups.values())
+
+    def _similarity_lookup(
+        self,
+        outputs: List[str],
+        threshold: float,
+        algorithm: SimilarityAlgorithm = "levenshtein",
+        batched: bool = True
+    ) -> Callable[[int, int], bool]:
+        """
+        Build a pairwise "is similar" predicate over output indices.
 
-            # Create new group if no match
-            if not found_group:
-                groups.append([response])
+        When rapidfuzz and numpy are available and `batched` is set, the full
+        similarity matrix is computed in a single `process.cdist` call so the
+        C layer handles every pair; otherwise pairs are compared on demand via
+        `_are_similar`, which lets rapidfuzz stop early at the threshold.
 
-        return groups
+        Args:
+            outputs: Response texts to compare
+            threshold: Similarity threshold (0.0-1.0)
+            algorithm: Similarity measure ("levenshtein" or "sift4")
+            batched: Precompute every pair when the caller will need most of them
+
+        Returns:
+            Callable taking two indices into `outputs`
+        """
+        if algorithm == "sift4":
+            return lambda i, j: self._sift4_similarity(outputs[i], outputs[j]) >= threshold
+
+        if batched and RAPIDFUZZ_AVAILABLE and CDIST_AVAILABLE and len(outputs) > 1:
+            # One native call computes the whole similarity matrix; large inputs
+            # are split across all cores (workers=-1), small ones stay single-threaded
+            work = len(outputs) * sum(map(len, outputs))
+            matrix = rapidfuzz_process.cdist(
+                outputs,
+                outputs,
+                scorer=RapidFuzzLevenshtein.normalized_similarity,
+                score_cutoff=threshold,
+                dtype=np.float64,
+                workers=-1 if work >= _CDIST_PARALLEL_MIN_WORK else 1,
+            ) >= threshold
+            return lambda i, j: bool(matrix[i, j])
+
+        return lambda i, j: self._are_similar(outputs[i], outputs[j], threshold)
 
     def _are_similar(
         self,
@@ -735,35 +1082,54 @@ class ConsensusEngine:
         Returns:
             True if similarity >= threshold
         """
-        similarity = self._calculate_similarity(text1, text2)
+        # Normalized Levenshtein similarity can never exceed shorter/longer,
+        # so pairs with very different lengths are rejected without the DP
+        len1, len2 = len(text1), len(text2)
+        longer = max(len1, len2)
+        if longer and min(len1, len2) < threshold * longer:
+            return False
+
+        similarity = self._calculate_similarity(text1, text2, score_cutoff=threshold)
         return similarity >= threshold
 
-    def _calculate_similarity(self, str1: str, str2: str) -> float:
+    def _calculate_similarity(
+        self,
+        str1: str,
+        str2: str,
+        score_cutoff: float = 0.0
+    ) -> float:
         """
         Calculate similarity between two strings.
 
         Uses normalized Levenshtein distance: 1.0 = identical, 0.0 = completely different
-        Uses rapidfuzz library when available, falls back to manual implementation.
+        Uses rapidfuzz library when available, then a numba-compiled DP,
+        and finally the pure-Python implementation.
 
         Args:
             str1: First string
             str2: Second string
+            score_cutoff: Similarities below this may be reported as 0.0, which
+                lets rapidfuzz abandon the computation early
 
         Returns:
             Similarity score (0.0-1.0)
         """
+        if RAPIDFUZZ_AVAILABLE:
+            # rapidfuzz normalizes in C using the same formula as below
+            return RapidFuzzLevenshtein.normalized_similarity(
+                str1, str2, score_cutoff=score_cutoff
+            )
+
         if not str1 and not str2:
             return 1.0
 
         if not str1 or not str2:
             return 0.0
 
-        # Calculate Levenshtein distance
-        if RAPIDFUZZ_AVAILABLE:
-            # Use rapidfuzz library (faster and battle-tested)
-            distance = RapidFuzzLevenshtein.distance(str1, str2)
+        # Fall back to the compiled DP, then the pure-Python implementation
+        if NUMBA_AVAILABLE:
+            distance = int(_levenshtein_numba(_code_points(str1), _code_points(str2)))
         else:
-            # Fall back to manual implementation
             distance = self._levenshtein_distance_fallback(str1, str2)
 
         # Normalize: similarity = 1 - (distance / max_length)
@@ -772,11 +1138,71 @@ class ConsensusEngine:
 
         return max(0.0, min(1.0, similarity))
 
+    def _sift4_similarity(self, str1: str, str2: str) -> float:
+        """
+        Approximate string similarity using the Sift4 (simplest) algorithm.
+
+        Sift4 walks both strings once, looking up to _SIFT4_MAX_OFFSET
+        characters ahead after a mismatch, so it runs in roughly linear time.
+        It approximates Levenshtein and may under- or over-estimate it.
+
+        Args:
+            str1: First string
+            str2: Second string
+
+        Returns:
+            Similarity score (0.0-1.0)
+        """
+        len1, len2 = len(str1), len(str2)
+        if not len1 and not len2:
+            return 1.0
+        if not len1 or not len2:
+            return 0.0
+
+        cursor1 = cursor2 = 0
+        common = 0
+        local_common = 0
+        while cursor1 < len1 and cursor2 < len2:
+            if str1[cursor1] == str2[cursor2]:
+                local_common += 1
+            else:
+                common += local_common
+                local_common = 0
+                if cursor1 != cursor2:
+                    cursor1 = cursor2 = max(cursor1, cursor2)
+                # Aligning the cursors can push one past its string's end
+                if cursor1 >= len1 or cursor2 >= len2:
+                    break
+                for offset in range(_SIFT4_MAX_OFFSET):
+                    if cursor1 + offset >= len1 and cursor2 + offset >= len2:
+                        break
+                    if cursor1 + offset < len1 and str1[cursor1 + offset] == str2[cursor2]:
+                        cursor1 += offset - 1
+                        cursor2 -= 1
+                        break
+                    if cursor2 + offset < len2 and str1[cursor1] == str2[cursor2 + offset]:
+                        cursor1 -= 1
+                        cursor2 += offset - 1
+                        break
+            cursor1 += 1
+            cursor2 += 1
+            if cursor1 >= len1 or cursor2 >= len2:
+                common += local_common
+                local_common = 0
+                cursor1 = cursor2 = min(cursor1, cursor2)
+        common += local_common
+
+        # Sift4 distance is longest - common, so similarity is common / longest
+        return max(0.0, min(1.0, common / max(len1, len2)))
+
     def _levenshtein_distance_fallback(self, str1: str, str2: str) -> int:
         """
         Calculate Levenshtein distance between two strings (fallback implementation).
 
-        Dynamic programming implementation used when rapidfuzz is not available.
+        Bit-parallel Myers/Hyyrö algorithm used when rapidfuzz is not available.
+        Each DP column is encoded as vertical delta bit vectors in Python ints,
+        so one pass of bitwise operations per character of the longer string
+        advances a whole column: O(n * ceil(m / word)) work and O(m) memory.
 
         Args:
             str1: First string
@@ -785,37 +1211,52 @@ class ConsensusEngine:
         Returns:
             Edit distance (number of operations to transform str1 to str2)
         """
-        m, n = len(str1), len(str2)
-
-        # Create DP table
-        dp = [[0] * (n + 1) for _ in range(m + 1)]
-
-        # Initialize base cases
-        for i in range(m + 1):
-            dp[i][0] = i
-        for j in range(n + 1):
-            dp[0][j] = j
-
-        # Fill DP table
-        for i in range(1, m + 1):
-            for j in range(1, n + 1):
-                if str1[i - 1] == str2[j - 1]:
-                    dp[i][j] = dp[i - 1][j - 1]
-                else:
-                    dp[i][j] = 1 + min(
-                        dp[i - 1][j],      # deletion
-                        dp[i][j - 1],      # insertion
-                        dp[i - 1][j - 1]   # substitution
-                    )
-
-        return dp[m][n]
+        # Distance is symmetric; encode the shorter string as the pattern
+        if len(str1) > len(str2):
+            str1, str2 = str2, str1
+
+        m = len(str1)
+        if m == 0:
+            return len(str2)
+
+        # Pattern match vectors: bit i set where str1[i] == char
+        peq: Dict[str, int] = {}
+        for i, char in enumerate(str1):
+            peq[char] = peq.get(char, 0) | (1 << i)
+
+        mask = (1 << m) - 1
+        high_bit = 1 << (m - 1)
+        vp = mask  # vertical positive deltas (column 0 is 0..m)
+        vn = 0  # vertical negative deltas
+        distance = m
+
+        for char in str2:
+            eq = peq.get(char, 0)
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | ~(xh | vp)
+            hn = vp & xh
+
+            if hp & high_bit:
+                distance += 1
+            elif hn & high_bit:
+                distance -= 1
+
+            # Row 0 of the DP grows by one per column, so shift in a 1
+            hp = ((hp << 1) | 1) & mask
+            hn = (hn << 1) & mask
+            vp = (hn | ~(xv | hp)) & mask
+            vn = hp & xv
+
+        return distance
 
     def _score_response(self, response: PromptResponse) -> float:
         """
         Score response quality using configurable scoring.
 
         Uses ConsensusScoringConfig to determine scoring weights and penalties.
-        Supports custom scoring functions via config.
+        Supports custom scoring functions via config. Scores are memoized per
+        response for the duration of a consensus run.
 
         Args:
             response: The response to score
@@ -823,53 +1264,91 @@ class ConsensusEngine:
         Returns:
             Score (typically 0-120 range with default config, but can vary)
         """
-        # Use custom scorer if provided
-        if self.scoring_config.custom_scorer is not None:
-            return self.scoring_config.custom_scorer(response)
+        key = id(response)
+        cached = self._score_cache.get(key)
+        if cached is not None and cached[0] is response:
+            return cached[1]
+
+        score = self._scorer(response)
+        self._score_cache[key] = (response, score)
+        return score
+
+    @staticmethod
+    def _build_scorer(
+        config: ConsensusScoringConfig
+    ) -> Callable[[PromptResponse], float]:
+        """
+        Specialize the scoring function for a fixed scoring configuration.
 
-        # Base score
-        score = 100.0
+        Weights are read once and bound into a closure, and terms whose
+        weight is zero are left out, so scoring a response does no config
+        lookups and no scans for bonuses that cannot apply.
 
-        output = response.output
-        config = self.scoring_config
+        Args:
+            config: Scoring configuration to specialize for
+
+        Returns:
+            Function mapping a response to its score (see _score_response)
+        """
+        # Use custom scorer if provided
+        if config.custom_scorer is not None:
+            return config.custom_scorer
+
+        min_length = config.min_response_length
+        short_penalty = config.short_response_penalty
+        max_length = config.max_response_length
+        long_penalty = config.long_response_penalty
+        structured_bonus = config.structured_content_bonus
+        code_bonus = config.code_block_bonus
+        success_weight = config.success_weight
+        # (response attribute, weight) pairs, applied in this order
+        weighted_fields = tuple(
+            (field_name, weight)
+            for field_name, weight in (
+                ("output_tokens", config.token_count_weight),
+                ("cost_usd", config.cost_weight),           # negative = prefer lower cost
+                ("duration_seconds", config.latency_weight),  # negative = prefer lower latency
+            )
+            if weight != 0.0
+        )
+
+        # NOTE: provider_reputation_weight is not currently applied because
+        # PromptResponse does not include reputation metadata. To implement
+        # reputation scoring, we would need to:
+        # 1. Add reputation tracking infrastructure to ProviderRegistry
+        # 2. Include reputation score in PromptResponse or provider metadata
+        # 3. Apply the weight here: score += reputation * config.provider_reputation_weight
 
-        # Penalize very short responses
-        if len(output) < config.min_response_length:
-            score -= config.short_response_penalty
+        def score_response(response: PromptResponse) -> float:
+            # Base score
+            score = 100.0
 
-        # Penalize very long responses (might be verbose)
-        if len(output) > config.max_response_length:
-            score -= config.long_response_penalty
+            output = response.output
+            output_length = len(output)
 
-        # Bonus for structured content
-        if '\n' in output:
-            score += config.structured_content_bonus
+            # Penalize very short responses
+            if output_length < min_length:
+                score -= short_penalty
 
-        # Bonus for code blocks (markdown)
-        if '```' in output:
-            score += config.code_block_bonus
+            # Penalize very long responses (might be verbose)
+            if output_length > max_length:
+                score -= long_penalty
 
-        # Major penalty if not successful
-        if not response.success:
-            score -= config.success_weight
+            # Bonus for structured content (find stops at the first newline)
+            if structured_bonus and output.find('\n') != -1:
+                score += structured_bonus
 
-        # Apply token count weight (if configured)
-        if config.token_count_weight != 0.0:
-            score += response.output_tokens * config.token_count_weight
+            # Bonus for code blocks (markdown)
+            if code_bonus and output.find('```') != -1:
+                score += code_bonus
 
-        # Apply cost weight (negative = prefer lower cost)
-        if config.cost_weight != 0.0:
-            score += response.cost_usd * config.cost_weight
+            # Major penalty if not successful
+            if not response.success:
+                score -= success_weight
 
-        # Apply latency weight (negative = prefer lower latency)
-        if config.latency_weight != 0.0:
-            score += response.duration_seconds * config.latency_weight
+            for field_name, weight in weighted_fields:
+                score += getattr(response, field_name) * weight
 
-        # NOTE: provider_reputation_weight is not currently applied because
-        # PromptResponse does not include reputation metadata. To implement
-        # reputation scoring, we would need to:
-        # 1. Add reputation tracking infrastructure to ProviderRegistry
-        # 2. Include reputation score in PromptResponse or provider metadata
-        # 3. Apply the weight here: score += reputation * config.provider_reputation_weight
+            return max(0.0, score)
 
-        return max(0.0, score)
+        return score_response
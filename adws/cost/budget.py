@@ -6,18 +6,44 @@ and period-aware automatic resets.
 """
 
 import logging
+import math
 import threading
-from datetime import UTC, datetime, timedelta
+import time
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from decimal import Decimal, ROUND_HALF_UP
 from enum import Enum
-from typing import Optional, Dict
-from pydantic import BaseModel, Field, field_validator
+from functools import lru_cache
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field, computed_field, field_validator
+
+from adws.cost.money import micros_to_decimal, to_micros
 
 logger = logging.getLogger(__name__)
 
 # Module-level constant for unlimited budget representation
 UNLIMITED_BUDGET = Decimal("999999999999")
 
+# Number of lock shards the enforcer spreads workflows across (power of two)
+_LOCK_SHARDS = 16
+
+@lru_cache(maxsize=1024, typed=True)
+def _dec_from_float(v: float) -> Decimal:
+    """
+    Convert a float to the Decimal of its shortest repr, e.g. 0.1 -> Decimal("0.1").
+
+    Cached because the same rates and costs recur within a session, and
+    Decimal is immutable so cached results are safe to share. The cache is
+    bounded to a few KB, and typed so that 5 and 5.0 keep distinct results.
+
+    Args:
+        v: Float to convert
+
+    Returns:
+        Decimal representation of the value
+    """
+    return Decimal(repr(v))
+
 
 def _convert_to_decimal(v) -> Decimal:
     """
@@ -32,10 +58,13 @@ def _convert_to_decimal(v) -> Decimal:
     Returns:
         Decimal representation of the value
     """
-    if isinstance(v, (int, float)):
+    if isinstance(v, int):
+        # Exact, and no need to go through a string
+        return Decimal(v)
+    elif isinstance(v, float):
         if v == float('inf'):
             return UNLIMITED_BUDGET
-        return Decimal(str(v))
+        return _dec_from_float(v)
     elif isinstance(v, str):
         if v in ("inf", "Infinity"):
             return UNLIMITED_BUDGET
@@ -118,6 +147,57 @@ class Budget(BaseModel):
         return v.quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
 
 
+# Reset interval per period in seconds; months are approximated as 30 days.
+# Periods not listed here never reset.
+_PERIOD_SECONDS: Dict[BudgetPeriod, float] = {
+    BudgetPeriod.HOURLY: 3600.0,
+    BudgetPeriod.DAILY: 86400.0,
+    BudgetPeriod.WEEKLY: 604800.0,
+    BudgetPeriod.MONTHLY: 2592000.0,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class _BudgetLimits:
+    """
+    Immutable snapshot of a budget and the integer limits derived from it.
+
+    Published with a single attribute assignment, so a reader that loads it
+    once never pairs a new budget with the previous budget's limits.
+
+    Attributes:
+        budget: Budget configuration (None = no enforcement)
+        max_micros: Maximum cost in micro-USD
+        warn_micros: Cost at which the warning threshold is reached, in micro-USD
+        reset_seconds: Period length in seconds (None = never resets)
+    """
+
+    budget: Optional[Budget] = None
+    max_micros: int = 0
+    warn_micros: int = 0
+    reset_seconds: Optional[float] = None
+
+    @property
+    def enforced(self) -> bool:
+        """Whether the budget is set and enabled."""
+        return self.budget is not None and self.budget.enabled
+
+    @classmethod
+    def for_budget(cls, budget: Optional[Budget]) -> "_BudgetLimits":
+        """Derive the limits for a budget (None = no enforcement)."""
+        if budget is None:
+            return cls()
+        # max_cost_usd is already quantized to 6 places, so this is exact;
+        # warning fires once cost / max >= threshold, i.e. cost >= ceil(max * threshold)
+        max_micros = int(budget.max_cost_usd.scaleb(6))
+        return cls(
+            budget=budget,
+            max_micros=max_micros,
+            warn_micros=math.ceil(max_micros * budget.warning_threshold),
+            reset_seconds=_PERIOD_SECONDS.get(budget.period),
+        )
+
+
 class BudgetStatus(BaseModel):
     """
     Budget status information with Decimal precision.
@@ -126,7 +206,7 @@ class BudgetStatus(BaseModel):
         current_cost: Current cost in period (Decimal)
         max_cost: Maximum allowed cost (Decimal, may be very large for unlimited)
         remaining: Remaining budget (Decimal)
-        percent_used: Percentage of budget used (0-100, Decimal)
+        percent_used: Percentage of budget used (0-100, Decimal; derived on access)
         exceeded: Whether budget is exceeded
         warning: Whether warning threshold reached
 
@@ -143,16 +223,56 @@ class BudgetStatus(BaseModel):
     current_cost: Decimal = Field(..., description="Current cost")
     max_cost: Decimal = Field(..., description="Max cost")
     remaining: Decimal = Field(..., description="Remaining budget")
-    percent_used: Decimal = Field(..., description="Percent used")
     exceeded: bool = Field(..., description="Whether exceeded")
     warning: bool = Field(..., description="Whether warning threshold reached")
 
-    @field_validator("current_cost", "max_cost", "remaining", "percent_used", mode="before")
+    @field_validator("current_cost", "max_cost", "remaining", mode="before")
     @classmethod
     def validate_decimal_fields(cls, v):
         """Convert to Decimal if needed."""
         return _convert_to_decimal(v)
 
+    @computed_field(description="Percent used")
+    @property
+    def percent_used(self) -> Decimal:
+        """Percentage of budget used, computed only when read."""
+        if not self.max_cost or self.max_cost >= UNLIMITED_BUDGET:
+            # Nothing meaningful to report against a zero or unlimited budget
+            return Decimal("0")
+        return (self.current_cost / self.max_cost) * Decimal("100")
+
+
+# Template for the status reported while no budget is enforced; callers get
+# a copy (BudgetStatus is mutable, so the template itself is never handed out)
+_DISABLED_STATUS = BudgetStatus.model_construct(
+    current_cost=Decimal("0"),
+    max_cost=UNLIMITED_BUDGET,
+    remaining=UNLIMITED_BUDGET,
+    exceeded=False,
+    warning=False,
+)
+
+
+def _disabled_status(cost: Optional[float] = None) -> BudgetStatus:
+    """
+    Status for a disabled budget, echoing `cost` when one is given.
+
+    Args:
+        cost: Cost to report (None = zero)
+
+    Returns:
+        Unlimited budget status
+    """
+    if cost is None:
+        return _DISABLED_STATUS.model_copy()
+    # Only real floats go through the repr cache; Decimal, int and str costs
+    # convert via str() as before
+    if type(cost) is float:
+        current_cost = _dec_from_float(cost)
+    else:
+        current_cost = Decimal(str(cost))
+    return _DISABLED_STATUS.model_copy(update={"current_cost": current_cost})
+
 
 class BudgetExceededError(Exception):
     """
@@ -172,22 +292,33 @@ class _LedgerEntry:
     Internal ledger entry for tracking workflow budget usage.
 
     Attributes:
-        current_cost: Accumulated cost for this workflow/period
-        last_reset_at: Timestamp of last reset (for period-based budgets)
+        current_cost_micros: Accumulated cost for this workflow/period in micro-USD
+        last_reset_at: Timestamp of last reset (UTC, for display)
+        last_reset_monotonic: time.monotonic() of last reset (for period checks)
         warned: Whether warning threshold has been logged
         exceeded: Whether budget has been exceeded for this workflow/period
     """
 
+    __slots__ = (
+        "current_cost_micros",
+        "last_reset_at",
+        "last_reset_monotonic",
+        "warned",
+        "exceeded",
+    )
+
     def __init__(self):
-        self.current_cost: Decimal = Decimal("0")
+        self.current_cost_micros: int = 0
         self.last_reset_at: datetime = datetime.now(UTC)
+        self.last_reset_monotonic: float = time.monotonic()
         self.warned: bool = False
         self.exceeded: bool = False
 
     def reset(self):
         """Reset ledger entry for new period."""
-        self.current_cost = Decimal("0")
+        self.current_cost_micros = 0
         self.last_reset_at = datetime.now(UTC)
+        self.last_reset_monotonic = time.monotonic()
         self.warned = False
         self.exceeded = False
 
@@ -197,10 +328,13 @@ class BudgetEnforcer:
     Thread-safe budget enforcer with stateful ledger tracking.
 
     Maintains per-workflow cost ledger with automatic period-based resets.
-    Uses Decimal for precise currency math. Thread-safe for concurrent access.
+    The ledger keeps integer micro-USD so per-call accounting is exact integer
+    math; Decimal values are only built for the returned BudgetStatus.
+    Thread-safe for concurrent access.
 
-    Thread-safe: This implementation IS thread-safe using threading.RLock().
-    Multiple threads can safely call enforce_budget() concurrently.
+    Thread-safe: This implementation IS thread-safe. Workflows are hashed onto
+    _LOCK_SHARDS plain locks, so concurrent calls for different workflows
+    rarely contend, while calls for the same workflow are serialized.
 
     Example:
         >>> from adws.cost import Budget, BudgetPeriod
@@ -230,61 +364,113 @@ class BudgetEnforcer:
             >>> budget = Budget(max_cost_usd=10.0, period=BudgetPeriod.DAILY)
             >>> enforcer = BudgetEnforcer(budget)
         """
-        self.budget = budget
-        self._lock = threading.RLock()
+        # No method re-enters another while holding its shard, so plain Locks suffice
+        self._locks = tuple(threading.Lock() for _ in range(_LOCK_SHARDS))
         self._ledger: Dict[str, _LedgerEntry] = {}
+        # Budget and derived limits, replaced as a whole; each call reads it once
+        self._limits: _BudgetLimits = _BudgetLimits.for_budget(budget)
+
+    @property
+    def budget(self) -> Optional[Budget]:
+        """Budget configuration (None = no enforcement)."""
+        return self._limits.budget
+
+    @budget.setter
+    def budget(self, budget: Optional[Budget]) -> None:
+        self._limits = _BudgetLimits.for_budget(budget)
+
+    def _lock_for(self, adw_id: str) -> threading.Lock:
+        """Return the lock guarding the ledger entry for a workflow."""
+        return self._locks[hash(adw_id) & (_LOCK_SHARDS - 1)]
 
-    def _should_reset(self, period: BudgetPeriod, last_reset: datetime) -> bool:
+    def _build_status(
+        self,
+        limits: _BudgetLimits,
+        cost_micros: int,
+        exceeded: bool
+    ) -> BudgetStatus:
         """
-        Check if budget period should reset based on time elapsed.
+        Materialize a BudgetStatus for an enabled budget from micro-USD.
 
         Args:
-            period: Budget period type
-            last_reset: Last reset timestamp
+            limits: Budget snapshot the status is reported against
+            cost_micros: Cost to report, in micro-USD
+            exceeded: Whether to report the budget as exceeded
 
         Returns:
-            True if period should reset
+            Budget status with Decimal amounts
         """
-        if period in (BudgetPeriod.PER_WORKFLOW, BudgetPeriod.TOTAL):
-            return False
-
-        now = datetime.now(UTC)
-        delta = now - last_reset
+        return BudgetStatus.model_construct(
+            current_cost=micros_to_decimal(cost_micros),
+            max_cost=limits.budget.max_cost_usd,
+            remaining=micros_to_decimal(max(0, limits.max_micros - cost_micros)),
+            exceeded=exceeded,
+            warning=cost_micros >= limits.warn_micros,
+        )
+
+    def _should_reset(self, entry: _LedgerEntry, limits: _BudgetLimits) -> bool:
+        """
+        Check if budget period should reset based on time elapsed.
 
-        if period == BudgetPeriod.HOURLY:
-            return delta >= timedelta(hours=1)
-        elif period == BudgetPeriod.DAILY:
-            return delta >= timedelta(days=1)
-        elif period == BudgetPeriod.WEEKLY:
-            return delta >= timedelta(weeks=1)
-        elif period == BudgetPeriod.MONTHLY:
-            # Approximate month as 30 days
-            return delta >= timedelta(days=30)
+        Args:
+            entry: Ledger entry to check
+            limits: Budget snapshot giving the period length
 
-        return False
+        Returns:
+            True if period should reset
+        """
+        reset_seconds = limits.reset_seconds
+        return (
+            reset_seconds is not None
+            and time.monotonic() - entry.last_reset_monotonic >= reset_seconds
+        )
 
-    def _get_or_create_entry(self, adw_id: str) -> _LedgerEntry:
+    def _get_or_create_entry(self, adw_id: str, limits: _BudgetLimits) -> _LedgerEntry:
         """
-        Get or create ledger entry for workflow (must be called with lock held).
+        Get or create ledger entry for workflow (must be called with its shard lock held).
 
         Args:
             adw_id: Workflow identifier
+            limits: Budget snapshot giving the period
 
         Returns:
             Ledger entry for this workflow
         """
-        if adw_id not in self._ledger:
-            self._ledger[adw_id] = _LedgerEntry()
-
-        entry = self._ledger[adw_id]
+        ledger = self._ledger
+        entry = ledger.get(adw_id)
+        if entry is None:
+            # A fresh entry starts a new period, so it never needs a reset
+            entry = ledger[adw_id] = _LedgerEntry()
+            return entry
 
         # Check if period reset is needed
-        if self.budget and self._should_reset(self.budget.period, entry.last_reset_at):
-            logger.info(f"Resetting budget for {adw_id} (period: {self.budget.period})")
+        if self._should_reset(entry, limits):
+            logger.info("Resetting budget for %s (period: %s)", adw_id, limits.budget.period)
             entry.reset()
 
         return entry
 
+    def _current_entry(self, adw_id: str, limits: _BudgetLimits) -> _LedgerEntry:
+        """
+        Get the ledger entry for reading, taking the shard lock only if it must change.
+
+        Reading an int attribute is atomic under the GIL, so read-only callers
+        skip the lock whenever the entry exists and needs no period reset.
+        Creating or resetting an entry still happens under the lock.
+
+        Args:
+            adw_id: Workflow identifier
+            limits: Budget snapshot giving the period
+
+        Returns:
+            Ledger entry for this workflow
+        """
+        entry = self._ledger.get(adw_id)
+        if entry is None or self._should_reset(entry, limits):
+            with self._lock_for(adw_id):
+                entry = self._get_or_create_entry(adw_id, limits)
+        return entry
+
     def check_budget(
         self,
         adw_id: str,
@@ -307,41 +493,21 @@ class BudgetEnforcer:
             >>> status = enforcer.check_budget("adw_123")
             >>> print(f"Used: {status.percent_used:.1f}%")
         """
-        with self._lock:
-            if not self.budget or not self.budget.enabled:
+        limits = self._limits
+        with self._lock_for(adw_id):
+            if not limits.enforced:
                 # No budget enforcement
-                cost = Decimal(str(current_cost)) if current_cost is not None else Decimal("0")
-                return BudgetStatus(
-                    current_cost=cost,
-                    max_cost=UNLIMITED_BUDGET,
-                    remaining=UNLIMITED_BUDGET,
-                    percent_used=Decimal("0"),
-                    exceeded=False,
-                    warning=False,
-                )
+                return _disabled_status(current_cost)
 
             # Use ledger if current_cost not provided (new behavior)
             if current_cost is None:
-                entry = self._get_or_create_entry(adw_id)
-                cost = entry.current_cost
+                entry = self._get_or_create_entry(adw_id, limits)
+                cost_micros = entry.current_cost_micros
             else:
                 # Backward compatibility: use provided current_cost
-                cost = Decimal(str(current_cost))
-
-            max_cost = self.budget.max_cost_usd
-            remaining = max(Decimal("0"), max_cost - cost)
-            percent_used = (cost / max_cost) * Decimal("100")
-            exceeded = cost > max_cost
-            warning = (cost / max_cost) >= self.budget.warning_threshold
-
-            return BudgetStatus(
-                current_cost=cost,
-                max_cost=max_cost,
-                remaining=remaining,
-                percent_used=percent_used,
-                exceeded=exceeded,
-                warning=warning,
-            )
+                cost_micros = to_micros(current_cost)
+
+            return self._build_status(limits, cost_micros, cost_micros > limits.max_micros)
 
     def enforce_budget(
         self,
@@ -370,85 +536,146 @@ class BudgetEnforcer:
             ... except BudgetExceededError as e:
             ...     print(f"Budget exceeded: {e.budget_status.percent_used:.1f}%")
         """
-        with self._lock:
-            if not self.budget or not self.budget.enabled:
+        limits = self._limits
+        with self._lock_for(adw_id):
+            if not limits.enforced:
                 # No budget enforcement - return dummy status
-                cost = Decimal("0")
-                if cost_increment is not None:
-                    cost = Decimal(str(cost_increment))
-                elif current_cost is not None:
-                    cost = Decimal(str(current_cost))
-
-                return BudgetStatus(
-                    current_cost=cost,
-                    max_cost=UNLIMITED_BUDGET,
-                    remaining=UNLIMITED_BUDGET,
-                    percent_used=Decimal("0"),
-                    exceeded=False,
-                    warning=False,
+                return _disabled_status(
+                    cost_increment if cost_increment is not None else current_cost
                 )
 
-            entry = self._get_or_create_entry(adw_id)
+            entry = self._get_or_create_entry(adw_id, limits)
+
+            # A zero increment (e.g. a cache hit) below the warning threshold
+            # cannot warn, exceed, or change the ledger
+            if (
+                cost_increment == 0
+                and not entry.exceeded
+                and entry.current_cost_micros < limits.warn_micros
+            ):
+                return self._build_status(limits, entry.current_cost_micros, False)
 
             # Determine projected cost without mutating ledger yet
-            cost = entry.current_cost
-            projected_cost = cost
+            projected_micros = entry.current_cost_micros
             if cost_increment is not None:
                 if cost_increment < 0:
                     raise ValueError("cost_increment must be non-negative")
-                increment = Decimal(str(cost_increment))
-                projected_cost = cost + increment
+                projected_micros += to_micros(cost_increment)
             elif current_cost is not None:
                 # Backward compatibility: treat as absolute current_cost
-                projected_cost = Decimal(str(current_cost))
-
-            # Calculate status based on projected cost
-            max_cost = self.budget.max_cost_usd
-            cost = projected_cost
-            remaining = max(Decimal("0"), max_cost - cost)
-            percent_used = (cost / max_cost) * Decimal("100")
-            exceeded = cost > max_cost
-            warning = (cost / max_cost) >= self.budget.warning_threshold
-
-            status = BudgetStatus(
-                current_cost=cost,
-                max_cost=max_cost,
-                remaining=remaining,
-                percent_used=percent_used,
-                exceeded=exceeded,
-                warning=warning,
+                projected_micros = to_micros(current_cost)
+
+            return self._apply_projection(
+                adw_id,
+                limits,
+                entry,
+                projected_micros,
+                commit=cost_increment is not None or current_cost is not None
             )
 
-            # Emit warnings
-            if warning and not entry.warned:
-                logger.warning(
-                    f"Budget warning for {adw_id}: "
-                    f"{float(status.percent_used):.1f}% of budget used "
-                    f"(${float(cost):.2f} / ${float(max_cost):.2f})"
-                )
-                entry.warned = True
-
-            # Raise if exceeded
-            if exceeded:
-                logger.error(
-                    f"Budget exceeded for {adw_id}: "
-                    f"${float(cost):.2f} / ${float(max_cost):.2f} "
-                    f"({float(percent_used):.1f}%)"
-                )
-                raise BudgetExceededError(
-                    f"Budget exceeded for {adw_id}: "
-                    f"${float(status.current_cost):.2f} / ${float(status.max_cost):.2f} "
-                    f"({float(status.percent_used):.1f}%)",
-                    budget_status=status,
-                )
+    def enforce_budget_many(
+        self,
+        adw_id: str,
+        increments: List[float]
+    ) -> BudgetStatus:
+        """
+        Enforce budget limit for several cost increments at once.
+
+        Takes the workflow lock once and runs a single warning/exceeded check
+        on the summed increments. The batch is all-or-nothing: if the total
+        would exceed the budget, none of it is added to the ledger.
+
+        Args:
+            adw_id: Workflow identifier
+            increments: Costs to add to ledger
+
+        Returns:
+            Budget status after applying all increments
+
+        Raises:
+            ValueError: If any increment is negative
+            BudgetExceededError: If budget would be exceeded
+
+        Example:
+            >>> enforcer.enforce_budget_many("adw_123", [0.05, 0.12, 0.03])
+        """
+        limits = self._limits
+        with self._lock_for(adw_id):
+            if not limits.enforced:
+                # No budget enforcement - return dummy status
+                return _disabled_status(sum(increments))
+
+            if any(increment < 0 for increment in increments):
+                raise ValueError("increments must be non-negative")
+
+            entry = self._get_or_create_entry(adw_id, limits)
+            # Round each increment like enforce_budget does, so a batch lands
+            # on the same ledger total as the equivalent sequence of calls
+            projected_micros = entry.current_cost_micros + sum(map(to_micros, increments))
+
+            return self._apply_projection(
+                adw_id, limits, entry, projected_micros, commit=True
+            )
+
+    def _apply_projection(
+        self,
+        adw_id: str,
+        limits: _BudgetLimits,
+        entry: _LedgerEntry,
+        projected_micros: int,
+        commit: bool
+    ) -> BudgetStatus:
+        """
+        Check a projected ledger cost, warn or raise, and optionally commit it.
+
+        Must be called with the workflow's shard lock held.
+
+        Args:
+            adw_id: Workflow identifier
+            limits: Budget snapshot to check against
+            entry: Ledger entry for the workflow
+            projected_micros: Projected cost in micro-USD
+            commit: Whether to store the projected cost if it fits the budget
 
-            # Safe to commit projected cost to ledger
-            if cost_increment is not None or current_cost is not None:
-                entry.current_cost = cost
-                if entry.current_cost >= max_cost:
-                    entry.exceeded = True
+        Returns:
+            Budget status for the projected cost
+
+        Raises:
+            BudgetExceededError: If the projected cost exceeds the budget
+        """
+        # Calculate status based on projected cost
+        max_micros = limits.max_micros
+        exceeded = projected_micros > max_micros
+        status = self._build_status(limits, projected_micros, exceeded)
+
+        # Emit warnings
+        if status.warning and not entry.warned:
+            logger.warning(
+                "Budget warning for %s: %.1f%% of budget used ($%.2f / $%.2f)",
+                adw_id, status.percent_used, status.current_cost, status.max_cost
+            )
+            entry.warned = True
+
+        # Raise if exceeded
+        if exceeded:
+            logger.error(
+                "Budget exceeded for %s: $%.2f / $%.2f (%.1f%%)",
+                adw_id, status.current_cost, status.max_cost, status.percent_used
+            )
+            raise BudgetExceededError(
+                f"Budget exceeded for {adw_id}: "
+                f"${float(status.current_cost):.2f} / ${float(status.max_cost):.2f} "
+                f"({float(status.percent_used):.1f}%)",
+                budget_status=status,
+            )
 
-            return status
+        # Safe to commit projected cost to ledger
+        if commit:
+            entry.current_cost_micros = projected_micros
+            if projected_micros >= max_micros:
+                entry.exceeded = True
+
+        return status
 
     def get_status(self, adw_id: str) -> BudgetStatus:
         """
@@ -464,34 +691,16 @@ class BudgetEnforcer:
             >>> status = enforcer.get_status("adw_123")
             >>> print(f"Current cost: ${status.current_cost}")
         """
-        with self._lock:
-            if not self.budget or not self.budget.enabled:
-                return BudgetStatus(
-                    current_cost=Decimal("0"),
-                    max_cost=UNLIMITED_BUDGET,
-                    remaining=UNLIMITED_BUDGET,
-                    percent_used=Decimal("0"),
-                    exceeded=False,
-                    warning=False,
-                )
+        limits = self._limits
+        if not limits.enforced:
+            return _disabled_status()
 
-            entry = self._get_or_create_entry(adw_id)
-            max_cost = self.budget.max_cost_usd
-            cost = entry.current_cost
-            remaining = max(Decimal("0"), max_cost - cost)
-            percent_used = (cost / max_cost) * Decimal("100")
-            # Use persisted exceeded flag (set during concurrent access) or check current state
-            exceeded = entry.exceeded or cost > max_cost
-            warning = (cost / max_cost) >= self.budget.warning_threshold
-
-            return BudgetStatus(
-                current_cost=cost,
-                max_cost=max_cost,
-                remaining=remaining,
-                percent_used=percent_used,
-                exceeded=exceeded,
-                warning=warning,
-            )
+        entry = self._current_entry(adw_id, limits)
+        cost_micros = entry.current_cost_micros
+        # Use persisted exceeded flag (set during concurrent access) or check current state
+        exceeded = entry.exceeded or cost_micros > limits.max_micros
+
+        return self._build_status(limits, cost_micros, exceeded)
 
     def can_afford(
         self,
@@ -515,21 +724,18 @@ class BudgetEnforcer:
             >>> if enforcer.can_afford("adw_123", additional_cost=1.0):
             ...     enforcer.enforce_budget("adw_123", cost_increment=1.0)
         """
-        with self._lock:
-            if not self.budget or not self.budget.enabled:
-                return True
+        limits = self._limits
+        if not limits.enforced:
+            return True
 
-            if current_cost is None:
-                # Use ledger
-                entry = self._get_or_create_entry(adw_id)
-                cost = entry.current_cost
-            else:
-                # Backward compatibility
-                cost = Decimal(str(current_cost))
+        if current_cost is None:
+            # Use ledger
+            cost_micros = self._current_entry(adw_id, limits).current_cost_micros
+        else:
+            # Backward compatibility
+            cost_micros = to_micros(current_cost)
 
-            additional = Decimal(str(additional_cost))
-            projected_cost = cost + additional
-            return projected_cost <= self.budget.max_cost_usd
+        return cost_micros + to_micros(additional_cost) <= limits.max_micros
 
     def set_budget(self, budget: Optional[Budget]) -> None:
         """
@@ -555,4 +761,4 @@ class BudgetEnforcer:
             >>> if enforcer.is_enabled():
             ...     print("Budget enforcement is active")
         """
-        return self.budget is not None and self.budget.enabled
+        return self._limits.enforced
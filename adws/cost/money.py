@@ -0,0 +1,46 @@
+"""
+Money Units
+
+Integer micro-USD helpers shared by the budget ledger and the cost tracker.
+Amounts are summed as whole micro-USD, so totals do not drift however many
+calls are added; Decimal values are only built for reporting.
+"""
+
+from decimal import Decimal
+
+# One USD in micro-USD (6 decimal places, matching Budget's quantize)
+MICROS_PER_USD = 1_000_000
+
+
+def to_micros(usd: float) -> int:
+    """
+    Convert a USD amount to integer micro-USD, rounding to the nearest micro.
+
+    Args:
+        usd: Amount in USD
+
+    Returns:
+        Amount in micro-USD
+
+    Example:
+        >>> to_micros(0.05)
+        50000
+    """
+    return int(round(usd * MICROS_PER_USD))
+
+
+def micros_to_decimal(micros: int) -> Decimal:
+    """
+    Convert integer micro-USD back to an exact Decimal USD amount.
+
+    Args:
+        micros: Amount in micro-USD
+
+    Returns:
+        Amount in USD
+
+    Example:
+        >>> micros_to_decimal(50000)
+        Decimal('0.050000')
+    """
+    return Decimal(micros).scaleb(-6)
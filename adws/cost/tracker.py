@@ -4,18 +4,30 @@ Cost Tracking
 Tracks LLM API costs across providers and workflows.
 """
 
+from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Dict, List, Optional
 from pydantic import BaseModel, Field
-from collections import defaultdict
+
+from adws.cost.money import MICROS_PER_USD, to_micros
 
 
-class CostRecord(BaseModel):
+def _utc_now() -> datetime:
+    """Current time as an aware UTC datetime."""
+    return datetime.now(timezone.utc)
+
+
+@dataclass(slots=True, frozen=True)
+class CostRecord:
     """
     Record of a single LLM API call cost.
 
+    A lightweight immutable record; values are validated by
+    :meth:`CostTracker.record_cost` rather than on construction.
+
     Attributes:
-        timestamp: When the call was made (UTC)
         adw_id: Workflow identifier
         provider: Provider name (e.g., 'claude', 'openai')
         model: Model identifier
@@ -25,6 +37,7 @@ class CostRecord(BaseModel):
         total_tokens: Total tokens (input + output)
         slash_command: Slash command that triggered the call
         success: Whether the call succeeded
+        timestamp: When the call was made (UTC)
 
     Example:
         >>> record = CostRecord(
@@ -34,23 +47,21 @@ class CostRecord(BaseModel):
         ...     cost_usd=0.05,
         ...     input_tokens=1000,
         ...     output_tokens=2000,
+        ...     total_tokens=3000,
         ...     slash_command="/implement"
         ... )
     """
 
-    timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc),
-        description="Timestamp (UTC)"
-    )
-    adw_id: str = Field(..., description="Workflow ID")
-    provider: str = Field(..., description="Provider name")
-    model: str = Field(..., description="Model identifier")
-    cost_usd: float = Field(..., description="Cost in USD", ge=0.0)
-    input_tokens: int = Field(..., description="Input tokens", ge=0)
-    output_tokens: int = Field(..., description="Output tokens", ge=0)
-    total_tokens: int = Field(..., description="Total tokens", ge=0)
-    slash_command: str = Field(..., description="Slash command")
-    success: bool = Field(True, description="Whether call succeeded")
+    adw_id: str
+    provider: str
+    model: str
+    cost_usd: float
+    input_tokens: int
+    output_tokens: int
+    total_tokens: int
+    slash_command: str
+    success: bool = True
+    timestamp: datetime = field(default_factory=_utc_now)
 
 
 class CostReport(BaseModel):
@@ -65,7 +76,7 @@ class CostReport(BaseModel):
         failure_count: Number of failed calls
         by_provider: Cost breakdown by provider
         by_model: Cost breakdown by model
-        records: Individual cost records
+        records: Individual cost records (only with include_records=True)
 
     Example:
         >>> report = tracker.get_report("adw_123")
@@ -92,12 +103,74 @@ class CostReport(BaseModel):
     )
 
 
+class _CostAggregate:
+    """
+    Internal running totals for a set of cost records.
+
+    Costs are summed as integer micro-USD, the same unit as the budget
+    ledger, so totals do not drift however many records are added.
+
+    Attributes:
+        total_cost_micros: Sum of record costs in micro-USD
+        total_tokens: Sum of record token counts
+        call_count: Number of records
+        success_count: Number of successful records
+        by_provider: Cost by provider in micro-USD
+        by_model: Cost by model in micro-USD
+    """
+
+    __slots__ = (
+        "total_cost_micros",
+        "total_tokens",
+        "call_count",
+        "success_count",
+        "by_provider",
+        "by_model",
+    )
+
+    def __init__(self):
+        self.total_cost_micros: int = 0
+        self.total_tokens: int = 0
+        self.call_count: int = 0
+        self.success_count: int = 0
+        self.by_provider: Dict[str, int] = defaultdict(int)
+        self.by_model: Dict[str, int] = defaultdict(int)
+
+    @property
+    def total_cost(self) -> float:
+        """Total cost in USD."""
+        return self.total_cost_micros / MICROS_PER_USD
+
+    def add(self, record: CostRecord) -> None:
+        """Fold one record into the totals."""
+        cost_micros = to_micros(record.cost_usd)
+        self.total_cost_micros += cost_micros
+        self.total_tokens += record.total_tokens
+        self.call_count += 1
+        if record.success:
+            self.success_count += 1
+        self.by_provider[record.provider] += cost_micros
+        self.by_model[record.model] += cost_micros
+
+    def merge(self, other: "_CostAggregate") -> None:
+        """Fold another aggregate's totals into this one."""
+        self.total_cost_micros += other.total_cost_micros
+        self.total_tokens += other.total_tokens
+        self.call_count += other.call_count
+        self.success_count += other.success_count
+        for provider, cost_micros in other.by_provider.items():
+            self.by_provider[provider] += cost_micros
+        for model, cost_micros in other.by_model.items():
+            self.by_model[model] += cost_micros
+
+
 class CostTracker:
     """
     Track LLM API costs across providers and workflows.
 
     Maintains in-memory records of all API calls and their costs.
-    Provides reporting and analysis capabilities.
+    Provides reporting and analysis capabilities. Totals are kept up to date
+    as records arrive, so reports do not rescan the records.
 
     Thread-safe: This implementation is not thread-safe. If used in
     multi-threaded contexts, external synchronization is required.
@@ -120,8 +193,9 @@ class CostTracker:
 
     def __init__(self):
         """Initialize cost tracker"""
-        self._records: List[CostRecord] = []
         self._by_workflow: Dict[str, List[CostRecord]] = defaultdict(list)
+        self._aggregate = _CostAggregate()
+        self._workflow_aggregates: Dict[str, _CostAggregate] = defaultdict(_CostAggregate)
 
     def record_cost(
         self,
@@ -150,6 +224,9 @@ class CostTracker:
         Returns:
             Created CostRecord
 
+        Raises:
+            ValueError: If cost_usd or a token count is negative
+
         Example:
             >>> record = tracker.record_cost(
             ...     adw_id="adw_123",
@@ -161,6 +238,14 @@ class CostTracker:
             ...     slash_command="/implement"
             ... )
         """
+        if cost_usd < 0:
+            raise ValueError(f"cost_usd must be >= 0, got {cost_usd}")
+        if input_tokens < 0 or output_tokens < 0:
+            raise ValueError(
+                f"Token counts must be >= 0, got input={input_tokens}, "
+                f"output={output_tokens}"
+            )
+
         record = CostRecord(
             adw_id=adw_id,
             provider=provider,
@@ -173,17 +258,24 @@ class CostTracker:
             success=success,
         )
 
-        self._records.append(record)
         self._by_workflow[adw_id].append(record)
+        self._aggregate.add(record)
+        self._workflow_aggregates[adw_id].add(record)
 
         return record
 
-    def get_report(self, adw_id: Optional[str] = None) -> CostReport:
+    def get_report(
+        self,
+        adw_id: Optional[str] = None,
+        include_records: bool = False
+    ) -> CostReport:
         """
         Get cost report.
 
         Args:
             adw_id: Workflow ID (None for all workflows)
+            include_records: Whether to attach the individual records
+                (a copy of the record list, built only when requested)
 
         Returns:
             CostReport with aggregated data
@@ -193,44 +285,42 @@ class CostTracker:
             >>> report = tracker.get_report("adw_123")
             >>> print(f"Cost: ${report.total_cost:.4f}")
             >>>
-            >>> # Get report for all workflows
-            >>> total_report = tracker.get_report()
+            >>> # Get report for all workflows, with individual records
+            >>> total_report = tracker.get_report(include_records=True)
         """
-        # Select records
+        # Select running totals
         if adw_id:
-            records = self._by_workflow.get(adw_id, [])
+            aggregate = self._workflow_aggregates.get(adw_id)
         else:
-            records = self._records
+            aggregate = self._aggregate
 
-        if not records:
+        if aggregate is None or not aggregate.call_count:
             return CostReport()
 
-        # Calculate aggregates
-        total_cost = sum(r.cost_usd for r in records)
-        total_tokens = sum(r.total_tokens for r in records)
-        call_count = len(records)
-        success_count = sum(1 for r in records if r.success)
-        failure_count = call_count - success_count
-
-        # Group by provider
-        by_provider: Dict[str, float] = defaultdict(float)
-        for record in records:
-            by_provider[record.provider] += record.cost_usd
-
-        # Group by model
-        by_model: Dict[str, float] = defaultdict(float)
-        for record in records:
-            by_model[record.model] += record.cost_usd
-
-        return CostReport(
-            total_cost=total_cost,
-            total_tokens=total_tokens,
-            call_count=call_count,
-            success_count=success_count,
-            failure_count=failure_count,
-            by_provider=dict(by_provider),
-            by_model=dict(by_model),
-            records=records.copy(),
+        records: List[CostRecord] = []
+        if include_records:
+            if adw_id:
+                records = list(self._by_workflow[adw_id])
+            else:
+                # Records are stored per workflow only; chain them on demand
+                records = list(chain.from_iterable(self._by_workflow.values()))
+
+        # Totals come from validated records, so skip re-validating them
+        return CostReport.model_construct(
+            total_cost=aggregate.total_cost,
+            total_tokens=aggregate.total_tokens,
+            call_count=aggregate.call_count,
+            success_count=aggregate.success_count,
+            failure_count=aggregate.call_count - aggregate.success_count,
+            by_provider={
+                provider: cost_micros / MICROS_PER_USD
+                for provider, cost_micros in aggregate.by_provider.items()
+            },
+            by_model={
+                model: cost_micros / MICROS_PER_USD
+                for model, cost_micros in aggregate.by_model.items()
+            },
+            records=records,
         )
 
     def get_workflow_cost(self, adw_id: str) -> float:
@@ -247,8 +337,8 @@ class CostTracker:
             >>> cost = tracker.get_workflow_cost("adw_123")
             >>> print(f"Workflow cost: ${cost:.4f}")
         """
-        records = self._by_workflow.get(adw_id, [])
-        return sum(r.cost_usd for r in records)
+        aggregate = self._workflow_aggregates.get(adw_id)
+        return aggregate.total_cost if aggregate is not None else 0
 
     def get_workflow_tokens(self, adw_id: str) -> int:
         """
@@ -264,8 +354,8 @@ class CostTracker:
             >>> tokens = tracker.get_workflow_tokens("adw_123")
             >>> print(f"Tokens used: {tokens:,}")
         """
-        records = self._by_workflow.get(adw_id, [])
-        return sum(r.total_tokens for r in records)
+        aggregate = self._workflow_aggregates.get(adw_id)
+        return aggregate.total_tokens if aggregate is not None else 0
 
     def clear(self) -> None:
         """
@@ -274,8 +364,9 @@ class CostTracker:
         Example:
             >>> tracker.clear()
         """
-        self._records.clear()
         self._by_workflow.clear()
+        self._aggregate = _CostAggregate()
+        self._workflow_aggregates.clear()
 
     def clear_workflow(self, adw_id: str) -> None:
         """
@@ -288,16 +379,19 @@ class CostTracker:
             >>> tracker.clear_workflow("adw_123")
         """
         if adw_id in self._by_workflow:
-            # Remove from workflow index
-            workflow_records = self._by_workflow[adw_id]
+            # Records live only in the workflow index
             del self._by_workflow[adw_id]
 
-            # Remove from main records list
-            self._records = [r for r in self._records if r.adw_id != adw_id]
+            # Rebuild global totals from the remaining per-workflow totals
+            del self._workflow_aggregates[adw_id]
+            self._aggregate = _CostAggregate()
+            for aggregate in self._workflow_aggregates.values():
+                self._aggregate.merge(aggregate)
 
 
-# Global cost tracker singleton
-_global_tracker: Optional[CostTracker] = None
+# Global cost tracker singleton, created at import time (under the import
+# lock) so lookups need no None check
+_global_tracker = CostTracker()
 
 
 def get_cost_tracker() -> CostTracker:
@@ -311,7 +405,4 @@ def get_cost_tracker() -> CostTracker:
         >>> tracker = get_cost_tracker()
         >>> tracker.record_cost(...)
     """
-    global _global_tracker
-    if _global_tracker is None:
-        _global_tracker = CostTracker()
     return _global_tracker
@@ -14,15 +14,29 @@ Public API exports:
 - EventBusConfig, get_event_bus, create_event_bus, reset_event_bus
 """
 
+import os
 import tempfile
-from typing import Optional, Literal
+import threading
+from functools import lru_cache
+from typing import Callable, Dict, Optional, Literal, Tuple
 from pydantic import BaseModel, Field
 from adws.events.bus import EventBus
-from adws.events.backends.file import FileEventBus
 from adws.events.models import ADWEvent, EventType, EventSeverity
 from adws.events.filters import EventFilter
 
 
+# Default Unix socket path, resolved once (Security: use system temp dir)
+_DEFAULT_SOCKET_PATH = f"{tempfile.gettempdir()}/adws_events.sock"
+
+# Environment variables read by EventBusConfig.from_env(), in snapshot order
+_ENV_VARS = (
+    "ADWS_EVENT_BACKEND",
+    "ADWS_EVENT_BASE_DIR",
+    "ADWS_EVENT_SOCKET_PATH",
+    "ADWS_EVENT_QUEUE_URL",
+)
+
+
 class EventBusConfig(BaseModel):
     """
     EventBus configuration.
@@ -44,7 +58,7 @@ class EventBusConfig(BaseModel):
     )
 
     socket_path: str = Field(
-        default_factory=lambda: f"{tempfile.gettempdir()}/adws_events.sock",
+        default=_DEFAULT_SOCKET_PATH,
         description="Unix socket path for socket backend"
     )
 
@@ -63,6 +77,31 @@ class EventBusConfig(BaseModel):
         description="Batch size if batching enabled"
     )
 
+    batch_ms: int = Field(
+        default=50,
+        description="Max milliseconds an event stays buffered if batching enabled"
+    )
+
+    aggregated: bool = Field(
+        default=False,
+        description="File backend: write all workflows to one events.jsonl"
+    )
+
+    rate_limits: Dict[EventType, float] = Field(
+        default_factory=dict,
+        description="File backend: max persisted events/sec by event type"
+    )
+
+    coalesce: bool = Field(
+        default=False,
+        description="File backend: merge consecutive same-type events per batch"
+    )
+
+    compress: Literal["none", "zstd"] = Field(
+        default="none",
+        description="File backend: zstd-compress events (events.jsonl.zst)"
+    )
+
     @classmethod
     def from_env(cls) -> "EventBusConfig":
         """
@@ -76,22 +115,97 @@ class EventBusConfig(BaseModel):
 
         Returns:
             EventBusConfig with values from env or defaults
+
+        Note:
+            The validated config is cached per set of environment values, so
+            repeated calls (e.g. after reset_event_bus()) skip validation
+            while the environment is unchanged. Each call returns a deep
+            copy, so changes to one result never reach later ones.
         """
-        import os
-        return cls(
-            backend=os.getenv("ADWS_EVENT_BACKEND", "file"),  # type: ignore
-            base_dir=os.getenv("ADWS_EVENT_BASE_DIR", "agents"),
-            socket_path=os.getenv(
-                "ADWS_EVENT_SOCKET_PATH",
-                f"{tempfile.gettempdir()}/adws_events.sock"  # Security: use system temp dir
-            ),
-            queue_url=os.getenv("ADWS_EVENT_QUEUE_URL"),
-        )
+        snapshot = tuple(os.getenv(name) for name in _ENV_VARS)
+        return _config_from_env(cls, snapshot).model_copy(deep=True)
+
+
+@lru_cache(maxsize=1)
+def _config_from_env(
+    config_cls: type,
+    snapshot: Tuple[Optional[str], ...]
+) -> EventBusConfig:
+    """
+    Build (and cache) an EventBusConfig from an environment snapshot.
+
+    Args:
+        config_cls: EventBusConfig (or subclass) to instantiate
+        snapshot: Values of _ENV_VARS, in order (None if unset)
+
+    Returns:
+        Validated configuration
+    """
+    backend, base_dir, socket_path, queue_url = snapshot
+    return config_cls(
+        backend=backend if backend is not None else "file",
+        base_dir=base_dir if base_dir is not None else "agents",
+        socket_path=socket_path if socket_path is not None else _DEFAULT_SOCKET_PATH,
+        queue_url=queue_url,
+    )
+
+
+# Backend factories by EventBusConfig.backend name; each imports its backend
+# module on first use, so only the configured backend is ever loaded
+_BACKENDS: Dict[str, Callable[[EventBusConfig], EventBus]] = {}
+
+
+def _register(name: str) -> Callable:
+    """
+    Register an event bus factory for a backend name.
+
+    Args:
+        name: Backend name (EventBusConfig.backend value)
+
+    Returns:
+        Decorator adding the factory to _BACKENDS
+    """
+    def decorator(factory: Callable[[EventBusConfig], EventBus]):
+        _BACKENDS[name] = factory
+        return factory
+    return decorator
+
+
+@_register("file")
+def _create_file_bus(config: EventBusConfig) -> EventBus:
+    """Create a FileEventBus (JSONL files under config.base_dir)."""
+    from adws.events.backends.file import FileEventBus
+
+    return FileEventBus(
+        config.base_dir,
+        enable_batching=config.enable_batching,
+        batch_size=config.batch_size,
+        batch_ms=config.batch_ms,
+        aggregated=config.aggregated,
+        rate_limits=config.rate_limits,
+        compress=config.compress,
+        coalesce=config.coalesce,
+    )
+
+
+@_register("socket")
+def _create_socket_bus(config: EventBusConfig) -> EventBus:
+    """Socket backend implementation in Phase 5D (TUI)."""
+    raise NotImplementedError("SocketEventBus not yet implemented (Phase 5D)")
+
+
+@_register("queue")
+def _create_queue_bus(config: EventBusConfig) -> EventBus:
+    """Queue backend optional (production enhancement)."""
+    raise NotImplementedError("QueueEventBus not yet implemented")
 
 
 # Global event bus singleton
 _event_bus: Optional[EventBus] = None
 
+# Guards creation/reset of the singleton (not needed once it exists)
+_event_bus_lock = threading.Lock()
+
 
 def get_event_bus() -> EventBus:
     """
@@ -101,9 +215,10 @@ def get_event_bus() -> EventBus:
         EventBus instance (singleton)
 
     Thread Safety:
-    - Singleton creation is NOT thread-safe (use locks if needed)
+    - Singleton creation is thread-safe (double-checked lock; after the
+      first call the fast path takes no lock)
     - The EventBus instance itself IS thread-safe (Phase 3+)
-    - BaseEventBus uses RLock and copy-on-write for concurrent access
+    - BaseEventBus uses copy-on-write subscribers: publish takes no lock
 
     Note:
     - The returned bus supports concurrent publish/subscribe/unsubscribe
@@ -124,8 +239,10 @@ def get_event_bus() -> EventBus:
     global _event_bus
 
     if _event_bus is None:
-        config = EventBusConfig.from_env()
-        _event_bus = create_event_bus(config)
+        with _event_bus_lock:
+            if _event_bus is None:
+                config = EventBusConfig.from_env()
+                _event_bus = create_event_bus(config)
 
     return _event_bus
 
@@ -147,16 +264,11 @@ def create_event_bus(config: EventBusConfig) -> EventBus:
         >>> config = EventBusConfig(backend="file", base_dir="agents")
         >>> bus = create_event_bus(config)
     """
-    if config.backend == "file":
-        return FileEventBus(config.base_dir)
-    elif config.backend == "socket":
-        # Socket backend implementation in Phase 5D (TUI)
-        raise NotImplementedError("SocketEventBus not yet implemented (Phase 5D)")
-    elif config.backend == "queue":
-        # Queue backend optional (production enhancement)
-        raise NotImplementedError("QueueEventBus not yet implemented")
-    else:
-        raise ValueError(f"Unknown event backend: {config.backend}")
+    try:
+        factory = _BACKENDS[config.backend]
+    except KeyError:
+        raise ValueError(f"Unknown event backend: {config.backend}") from None
+    return factory(config)
 
 
 def reset_event_bus() -> None:
@@ -168,9 +280,30 @@ def reset_event_bus() -> None:
         >>> reset_event_bus()
     """
     global _event_bus
-    if _event_bus:
-        _event_bus.close()
-    _event_bus = None
+    with _event_bus_lock:
+        bus, _event_bus = _event_bus, None
+    if bus:
+        bus.close()
+
+
+def __getattr__(name: str):
+    """
+    Resolve FileEventBus on first access, keeping backend imports lazy.
+
+    Args:
+        name: Module attribute being looked up
+
+    Returns:
+        The FileEventBus class
+
+    Raises:
+        AttributeError: If name is not a lazily loaded attribute
+    """
+    if name == "FileEventBus":
+        from adws.events.backends.file import FileEventBus
+
+        return FileEventBus
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Public API
@@ -3,6 +3,7 @@ FileEventBus - JSONL file-based event persistence.
 
 This module provides file-based event storage using JSONL format (JSON Lines).
 Events are appended to: agents/{workflow_id}/events.jsonl
+(or to a single agents/events.jsonl in aggregated mode)
 
 Benefits:
 - Simple, reliable persistence
@@ -14,24 +15,241 @@ Benefits:
 Limitations:
 - Not real-time (file I/O latency)
 - No streaming to TUI (use SocketEventBus for that)
-- File size grows unbounded (need cleanup policies)
+- File size grows unbounded unless rotated (see FileEventBus.rotate())
+
+Batching:
+- Optional: publish() only enqueues the event; a background writer thread
+  appends queued events per workflow in one write once batch_size events
+  are pending or batch_ms has elapsed, so publishers never wait on the disk
+
+Aggregated mode:
+- Optional: all workflows share one events.jsonl, avoiding a directory,
+  inode, and open file per workflow; reads filter lines by workflow_id
+
+Rate limiting:
+- Optional: chatty event types (progress, heartbeats) are persisted at most
+  N times per second per workflow; suppressed events are coalesced into the
+  next one written (subscribers still receive every event)
+
+Coalescing:
+- Optional (coalesce=True, with batching): runs of consecutive events with
+  the same workflow, type, and source in a batch are written as the last
+  event of the run, with data["coalesced_count"]
+
+Compression:
+- Optional (compress="zstd", requires the zstandard package): each write is
+  appended to events.jsonl.zst as an independent zstd frame, so the file
+  stays appendable and can be streamed back line by line
+
+Durability:
+- Writes go straight to the kernel with os.write() on an O_APPEND file
+  descriptor; with batching, call sync() (or close()) to wait for queued events
+- CRITICAL events are written and fsync'd as soon as they are published
 """
 
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import groupby
 from pathlib import Path
-from typing import List, Callable
+from typing import Dict, Iterator, List, Callable, Optional, Set, Tuple
 from adws.events.bus import BaseEventBus
-from adws.events.models import ADWEvent
+from adws.events.filters import EventFilter
+from adws.events.models import ADWEvent, EventSeverity
+from pydantic_core import from_json, to_json
+import io
 import logging
+import mmap
+import os
+import queue
+import threading
+import time
+
+# Try to import zstandard for compressed event files (compress="zstd")
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+    _ZSTD_ERRORS: tuple = (zstandard.ZstdError,)
+except ImportError:
+    ZSTD_AVAILABLE = False
+    _ZSTD_ERRORS = ()
 
 
 logger = logging.getLogger(__name__)
 
+# Most event files kept open at once; least recently written are closed first
+_MAX_OPEN_HANDLES = 256
+
+# Event file name, per workflow directory (or in base_dir when aggregated)
+_EVENT_FILE = "events.jsonl"
+
+# Event file name with compress="zstd"
+_COMPRESSED_EVENT_FILE = "events.jsonl.zst"
+
+# zstd level for compressed event files (fast, ~10x on JSONL)
+_ZSTD_LEVEL = 3
+
+# Subdirectory (next to the event file) holding rotated event files
+_ARCHIVE_DIR = "archive"
+
+# File key shared by every workflow in aggregated mode
+_AGGREGATED_KEY = ""
+
+# Severities always persisted, regardless of rate limits
+_UNLIMITED_SEVERITIES = frozenset({EventSeverity.ERROR, EventSeverity.CRITICAL})
+
+# Event data key recording how many events a persisted event stands in for
+_SUPPRESSED_COUNT_KEY = "suppressed_count"
+
+# Event data key recording how many consecutive events were coalesced into one
+_COALESCED_COUNT_KEY = "coalesced_count"
+
+# Event files smaller than this are parsed serially by read_events_parallel()
+_PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+# Most (workflow_id, event_type) pairs whose rate-limit state is kept; the
+# least recently written pair is dropped first
+_MAX_RATE_LIMIT_KEYS = 4096
+
+# Most events queued for the writer thread; publishers block when it is full
+_MAX_QUEUED_EVENTS = 10_000
+
+# Seconds a publisher waits on a full queue (or for a sync) before checking
+# that the writer thread is still running
+_WRITER_POLL_SECONDS = 1.0
+
+# Writer queue item asking the writer thread to stop
+_STOP = object()
+
+# Append-only, close-on-exec descriptor flags (flags absent on a platform are 0)
+_OPEN_FLAGS = (
+    os.O_WRONLY | os.O_APPEND | os.O_CREAT
+    | getattr(os, "O_CLOEXEC", 0) | getattr(os, "O_BINARY", 0)
+)
+
+
+def _write_all(fd: int, payload: bytes) -> None:
+    """
+    Write a whole payload to a file descriptor, retrying short writes.
+
+    Args:
+        fd: File descriptor opened for writing
+        payload: Bytes to write
+    """
+    view = memoryview(payload)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
+
+
+def _parse_chunk(
+    chunk: bytes,
+    prefix: Optional[bytes] = None
+) -> Tuple[List[ADWEvent], List[Tuple[int, str]], int]:
+    """
+    Parse a block of whole JSONL lines (runs in a worker process).
+
+    Args:
+        chunk: Lines of an event file, split on line boundaries
+        prefix: Only parse lines starting with this (aggregated files)
+
+    Returns:
+        Tuple of (events, [(line index, error)] for malformed lines,
+        number of lines in the chunk)
+    """
+    events: List[ADWEvent] = []
+    errors: List[Tuple[int, str]] = []
+    lines = chunk.split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+
+    for index, line in enumerate(lines):
+        if not line or line.isspace():
+            continue
+        if prefix is not None and not line.startswith(prefix):
+            continue
+        try:
+            events.append(ADWEvent.from_jsonl(line))
+        except Exception as e:
+            errors.append((index, str(e)))
+
+    return events, errors, len(lines)
+
+
+# Queued writer item: (file key, line, durable, event if coalescable)
+_WriterItem = Tuple[str, bytes, bool, Optional[ADWEvent]]
+
+
+def _batch_file_key(item: _WriterItem) -> str:
+    """File key of a queued writer item."""
+    return item[0]
+
+
+def _with_count(event: ADWEvent, key: str, count: int) -> ADWEvent:
+    """
+    Copy of an event recording how many events it stands in for.
+
+    Args:
+        event: Event to annotate
+        key: Event data key for the count (e.g. "suppressed_count")
+        count: Number of events (0 = return event unchanged)
+
+    Returns:
+        Event with data[key] set
+    """
+    if count <= 0:
+        return event
+    return event.model_copy(update={"data": {**event.data, key: count}})
+
+
+def _coalesce_lines(items: List[_WriterItem]) -> List[bytes]:
+    """
+    Collapse runs of consecutive same (workflow, type, source) events.
+
+    Each run is replaced by its last event, annotated with
+    data["coalesced_count"]; events without a coalescable event
+    (e.g. ERROR/CRITICAL) are never merged.
+
+    Args:
+        items: Writer items for one event file, in publish order
+
+    Returns:
+        JSONL lines to write
+    """
+    lines: List[bytes] = []
+    run_key = None
+    run_event: Optional[ADWEvent] = None
+    run_count = 0
+
+    for _, line, _, event in items:
+        key = None
+        if event is not None:
+            key = (event.workflow_id, event.event_type, event.source)
+            if key == run_key:
+                lines[-1] = line
+                run_event = event
+                run_count += 1
+                continue
+
+        if run_count > 1:
+            lines[-1] = _with_count(
+                run_event, _COALESCED_COUNT_KEY, run_count
+            ).to_jsonl_bytes() + b"\n"
+        lines.append(line)
+        run_key, run_event, run_count = key, event, 1
+
+    if run_count > 1:
+        lines[-1] = _with_count(
+            run_event, _COALESCED_COUNT_KEY, run_count
+        ).to_jsonl_bytes() + b"\n"
+    return lines
+
 
 class FileEventBus(BaseEventBus):
     """
     File-based event backend using JSONL format.
 
     Events are appended to: agents/{workflow_id}/events.jsonl
+    (aggregated=True: agents/events.jsonl, shared by all workflows)
 
     Benefits:
     - Simple, reliable persistence
@@ -43,7 +261,66 @@ class FileEventBus(BaseEventBus):
     Limitations:
     - Not real-time (file I/O latency)
     - No streaming to TUI (use SocketEventBus for that)
-    - File size grows unbounded (need cleanup policies)
+    - File size grows unbounded unless rotated (see FileEventBus.rotate())
+
+    Batching (enable_batching=True):
+    - publish() serializes the event and puts it on a bounded queue; a
+      writer thread drains the queue and appends each workflow's lines with
+      one write once batch_size events are pending or after batch_ms
+    - Publishers never wait on the disk (only on a full queue, which bounds
+      memory when the disk cannot keep up)
+    - read_events() and close() wait for queued events first, so nothing is lost
+
+    Aggregated mode (aggregated=True):
+    - One events.jsonl for all workflows; each line carries its workflow_id
+    - Cuts per-workflow file overhead (mkdir, inode, open) for systems
+      running many short workflows
+    - read_events()/iter_events() scan the shared file and keep only lines
+      for the requested workflow (matched on the serialized workflow_id
+      prefix, without parsing other workflows' lines)
+
+    Rate limiting (rate_limits={event_type: events_per_second}):
+    - Each (workflow, event_type) pair with a limit is persisted at most
+      once per 1/rate seconds; ERROR and CRITICAL events are never limited
+    - The first event of a window is written; later ones are suppressed and
+      only the latest is kept. The next event written for that pair carries
+      data["suppressed_count"] (events dropped since the previous write)
+    - sync(), close(), and read_events() write the kept latest event, so the
+      last state of a limited event type is never lost
+    - Only persistence is limited: subscribers receive every event
+
+    Coalescing (coalesce=True, batching only):
+    - Within each written batch, consecutive events with the same
+      (workflow_id, event_type, source) are collapsed into the last one,
+      with data["coalesced_count"] = number of events in the run
+    - Cuts volume for bursts of progress events, at the cost of the
+      intermediate events in the audit trail; ERROR and CRITICAL events are
+      never coalesced
+
+    Compression (compress="zstd"):
+    - Events go to events.jsonl.zst; every write (one event, or one batch
+      with enable_batching) is compressed as an independent zstd frame and
+      appended, so a crash loses at most the frame being written
+    - Frames compress best when large: use together with enable_batching
+    - Reads decompress across frames as a stream (read_events_parallel()
+      reads compressed files serially)
+    - Requires the zstandard package; without it, a warning is logged and
+      plain events.jsonl is written
+
+    File descriptors:
+    - Each workflow's events.jsonl is opened once (O_APPEND) and the raw
+      descriptor is reused; lines are written with os.write(), bypassing
+      Python's buffered and text layers
+    - At most _MAX_OPEN_HANDLES files stay open; close() closes them all
+
+    Durability contract:
+    - Without batching, each event reaches the kernel (visible to tail -f)
+      when publish returns; it is not fsync'd
+    - With batching, events are written by the writer thread within batch_ms
+      of being published; sync(), close(), and read_events() wait for them
+    - Call sync() at phase boundaries when other processes (tail -f, a TUI)
+      need to see batched events
+    - CRITICAL events are always written and fsync'd before publish returns
 
     Usage:
         >>> bus = FileEventBus(base_dir="agents")
@@ -59,12 +336,35 @@ class FileEventBus(BaseEventBus):
         >>> bus.replay_events("wf-001", handler)
     """
 
-    def __init__(self, base_dir: str = "agents"):
+    def __init__(
+        self,
+        base_dir: str = "agents",
+        enable_batching: bool = False,
+        batch_size: int = 100,
+        batch_ms: int = 50,
+        aggregated: bool = False,
+        rate_limits: Optional[Dict[str, float]] = None,
+        compress: str = "none",
+        coalesce: bool = False,
+        executor: Optional[Executor] = None
+    ):
         """
         Initialize file event bus.
 
         Args:
             base_dir: Base directory for event files (default: "agents")
+            enable_batching: Buffer events and append them in batches
+                (default: False, every event is written immediately)
+            batch_size: Queued events that trigger a write
+            batch_ms: Maximum time in milliseconds an event stays queued
+            aggregated: Write all workflows to a single base_dir/events.jsonl
+            rate_limits: Max persisted events per second, by event type
+                (default: None, no limits)
+            compress: "none" (events.jsonl) or "zstd" (events.jsonl.zst)
+            coalesce: Merge consecutive same-type events within a batch
+                (batching only; changes the audit trail, default: False)
+            executor: Executor for sync handlers (default: the bus's own
+                thread pool; see BaseEventBus)
 
         Directory structure created:
             agents/
@@ -75,10 +375,72 @@ class FileEventBus(BaseEventBus):
             │   ├── events.jsonl
             │   └── ...
         """
-        super().__init__()
+        super().__init__(executor=executor)
         self.base_dir = Path(base_dir)
         self.logger = logging.getLogger(__name__)
 
+        self.enable_batching = enable_batching
+        self.batch_size = max(1, batch_size)
+        self.batch_ms = batch_ms
+        self.aggregated = aggregated
+        self.coalesce = coalesce
+
+        if compress not in ("none", "zstd"):
+            raise ValueError(f"Unknown event compression: {compress}")
+        if compress == "zstd" and not ZSTD_AVAILABLE:
+            self.logger.warning(
+                "zstandard not installed; writing uncompressed events.jsonl"
+            )
+            compress = "none"
+        self.compress = compress
+
+        # One compressor reused for every frame (guarded by the write lock)
+        self._compressor = (
+            zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+            if compress == "zstd" else None
+        )
+
+        # Minimum seconds between persisted events, by event type
+        self._min_intervals: Dict[str, float] = {
+            str(getattr(event_type, "value", event_type)): 1.0 / rate
+            for event_type, rate in (rate_limits or {}).items()
+            if rate > 0
+        }
+        # Per (workflow_id, event_type): monotonic time of the last write
+        # (least recently written first, at most _MAX_RATE_LIMIT_KEYS), and
+        # the latest suppressed event with the number suppressed (both
+        # guarded by the state lock)
+        self._state_lock = threading.Lock()
+        self._last_emit: "OrderedDict[Tuple[str, str], float]" = OrderedDict()
+        self._suppressed: Dict[Tuple[str, str], Tuple[ADWEvent, int]] = {}
+
+        # Serializes writes so each workflow's lines stay in publish order
+        self._write_lock = threading.Lock()
+
+        # Batching: _WriterItem tuples, or a threading.Event to
+        # set once everything queued before it is written, or _STOP
+        self._queue: "queue.Queue" = queue.Queue(maxsize=_MAX_QUEUED_EVENTS)
+        self._writer: Optional[threading.Thread] = None
+
+        # Open event file descriptors by file key, in least-recently-written
+        # order (guarded by the write lock)
+        self._handles: "OrderedDict[str, int]" = OrderedDict()
+
+        # Event directories already created by this process, so reopening an
+        # evicted file skips mkdir (guarded by the write lock)
+        self._known_dirs: Set[str] = set()
+
+        # Event file path strings by file key, computed once per workflow
+        self._paths: Dict[str, str] = {}
+
+        if enable_batching:
+            self._writer = threading.Thread(
+                target=self._drain_loop,
+                name="FileEventBus-writer",
+                daemon=True
+            )
+            self._writer.start()
+
     def _publish_to_backend(self, event: ADWEvent) -> None:
         """
         Append event to JSONL file.
@@ -89,81 +451,721 @@ class FileEventBus(BaseEventBus):
             {"workflow_id":"wf-001","event_type":"phase_started",...}
 
         Algorithm:
-            1. Create event directory if missing: agents/{workflow_id}/
-            2. Open events.jsonl in append mode
-            3. Write event as single JSON line + newline
-            4. Flush immediately (ensure written)
+            1. Rate-limited event type within its window: keep the event as
+               the latest suppressed one and stop
+            2. Serialize event as single UTF-8 JSON line + newline
+            3. Without batching: append it to agents/{workflow_id}/events.jsonl
+            4. With batching: queue it for the writer thread, which appends
+               it with other queued lines for the same file
 
         Error Handling:
         - If directory creation fails: log error, don't crash
         - If file write fails: log error, don't crash
         - Errors are non-fatal (workflow continues)
         """
-        try:
-            # Create event directory: agents/{workflow_id}/
-            event_dir = self.base_dir / event.workflow_id
-            event_dir.mkdir(parents=True, exist_ok=True)
+        if self._min_intervals and event.severity not in _UNLIMITED_SEVERITIES:
+            with self._state_lock:
+                event = self._rate_limit(event)
+                evicted = None
+                if len(self._last_emit) > _MAX_RATE_LIMIT_KEYS:
+                    evicted = self._evict_rate_state()
+            if evicted is not None:
+                # The kept event itself is written; it stands in for the rest
+                kept, count = evicted
+                self._append(_with_count(kept, _SUPPRESSED_COUNT_KEY, count - 1))
+            if event is None:
+                return
+        self._append(event)
 
-            # Event file path: agents/{workflow_id}/events.jsonl
-            event_file = event_dir / "events.jsonl"
+    def _rate_limit(self, event: ADWEvent) -> Optional[ADWEvent]:
+        """
+        Apply the event type's rate limit (state lock held).
 
-            # Append event (one line per event)
-            with open(event_file, "a", encoding="utf-8") as f:
-                f.write(event.to_jsonl() + "\n")
-                f.flush()  # Ensure written immediately (for tail -f)
+        Args:
+            event: Event being published
+
+        Returns:
+            Event to write (annotated with the suppressed count, if any),
+            or None if the event is suppressed
+        """
+        min_interval = self._min_intervals.get(event.event_type)
+        if min_interval is None:
+            return event
+
+        key = (event.workflow_id, event.event_type)
+        now = time.monotonic()
+        last = self._last_emit.get(key)
+        if last is not None and now - last < min_interval:
+            # Within the window: keep only the latest event, count the rest
+            _, count = self._suppressed.get(key, (None, 0))
+            self._suppressed[key] = (event, count + 1)
+            return None
+
+        self._last_emit[key] = now
+        self._last_emit.move_to_end(key)
+        suppressed = self._suppressed.pop(key, None)
+        if suppressed is None:
+            return event
+        return _with_count(event, _SUPPRESSED_COUNT_KEY, suppressed[1])
+
+    def _evict_rate_state(self) -> Optional[Tuple[ADWEvent, int]]:
+        """
+        Drop the least recently written pair's rate-limit state (state lock held).
+
+        Keeps long-running buses with many short workflows from growing the
+        state without bound; the pair's next event starts a new window.
+
+        Returns:
+            The pair's latest suppressed event and count, to be written, if any
+        """
+        key, _ = self._last_emit.popitem(last=False)
+        return self._suppressed.pop(key, None)
+
+    def _flush_suppressed(self, workflow_id: Optional[str] = None) -> None:
+        """
+        Write the latest suppressed event of each rate-limited event type.
+
+        Args:
+            workflow_id: Workflow to flush (None = every workflow)
+        """
+        with self._state_lock:
+            if not self._suppressed:
+                return
+            keys = [
+                key for key in self._suppressed
+                if workflow_id is None or key[0] == workflow_id
+            ]
+            pending = [self._suppressed.pop(key) for key in keys]
+
+        for event, count in pending:
+            # The kept event itself is written; it stands in for the rest
+            self._append(_with_count(event, _SUPPRESSED_COUNT_KEY, count - 1))
+
+    def _append(self, event: ADWEvent) -> None:
+        """
+        Write an event, or queue it for the writer thread.
+
+        Args:
+            event: Event to persist
+        """
+        line = event.to_jsonl_bytes() + b"\n"
+        file_key = self._file_key(event.workflow_id)
+        durable = event.severity == EventSeverity.CRITICAL
+
+        writer = self._writer
+        if writer is None:
+            # No batching (or already closed): write in the caller's thread
+            with self._write_lock:
+                self._write_lines(file_key, [line], durable)
+            return
+
+        coalescable = (
+            event if self.coalesce and event.severity not in _UNLIMITED_SEVERITIES
+            else None
+        )
+        item = (file_key, line, durable, coalescable)
+        queued = self._enqueue(writer, item)
+        if not queued or self._writer is None or not writer.is_alive():
+            # The writer stopped (bus closed concurrently, or the thread died)
+            # and may not have seen this event: write what it left behind
+            writer.join()
+            self._drain_queue()
+            if not queued:
+                self._write_batch([item])
+            return
+        if durable:
+            # CRITICAL events are on disk before publish returns
+            self._wait_for_writer()
+
+    def _file_key(self, workflow_id: str) -> str:
+        """Key of the event file holding a workflow's events."""
+        return _AGGREGATED_KEY if self.aggregated else workflow_id
+
+    def _event_file(self, file_key: str) -> Path:
+        """
+        Path of the event file for a file key.
+
+        Args:
+            file_key: Workflow identifier, or _AGGREGATED_KEY
+
+        Returns:
+            agents/{workflow_id}/events.jsonl, or agents/events.jsonl
+        """
+        name = _COMPRESSED_EVENT_FILE if self._compressor else _EVENT_FILE
+        if file_key == _AGGREGATED_KEY:
+            return self.base_dir / name
+        return self.base_dir / file_key / name
+
+    def _event_path(self, file_key: str) -> str:
+        """
+        Cached string path of the event file for a file key (write path).
+
+        Args:
+            file_key: Workflow identifier, or _AGGREGATED_KEY
+
+        Returns:
+            Same path as _event_file(), as a str
+        """
+        path = self._paths.get(file_key)
+        if path is None:
+            path = self._paths[file_key] = str(self._event_file(file_key))
+        return path
+
+    def _write_lines(
+        self,
+        file_key: str,
+        lines: List[bytes],
+        durable: bool = False
+    ) -> None:
+        """
+        Append JSONL lines to an event file (write lock held).
+
+        Args:
+            file_key: Workflow identifier, or _AGGREGATED_KEY
+            lines: Encoded events, each ending in a newline
+            durable: fsync the file after writing
+        """
+        try:
+            # Append all lines with a single write() syscall
+            payload = b"".join(lines)
+            if self._compressor is not None:
+                # One self-contained frame per write
+                payload = self._compressor.compress(payload)
+            fd = self._fd_for(file_key)
+            _write_all(fd, payload)
+            if durable:
+                os.fsync(fd)
 
             self.logger.debug(
-                f"Event written: {event.event_type} for {event.workflow_id}"
+                f"{len(lines)} event(s) written to {self._event_path(file_key)}"
             )
 
         except Exception as e:
             self.logger.error(
-                f"Failed to write event {event.event_type} to file: {e}",
+                f"Failed to write {len(lines)} event(s) to "
+                f"{self._event_path(file_key)}: {e}",
                 exc_info=True
             )
             # Don't propagate error (non-fatal)
 
-    def read_events(self, adw_id: str) -> List[ADWEvent]:
+    def _fd_for(self, file_key: str) -> int:
         """
-        Read all events for workflow from file.
+        Get the open descriptor for an event file, opening it on first use.
+
+        Must be called with the write lock held. Opening a file beyond
+        _MAX_OPEN_HANDLES closes the least recently written one.
+
+        Args:
+            file_key: Workflow identifier, or _AGGREGATED_KEY
+
+        Returns:
+            File descriptor opened with O_APPEND
+        """
+        handles = self._handles
+        fd = handles.get(file_key)
+        if fd is not None:
+            handles.move_to_end(file_key)
+            return fd
+
+        # Create event directory (agents/{workflow_id}/ or agents/), once
+        event_path = self._event_path(file_key)
+        if file_key not in self._known_dirs:
+            os.makedirs(os.path.dirname(event_path), exist_ok=True)
+            self._known_dirs.add(file_key)
+
+        try:
+            fd = os.open(event_path, _OPEN_FLAGS, 0o644)
+        except FileNotFoundError:
+            # Directory removed since it was created; recreate and retry
+            os.makedirs(os.path.dirname(event_path), exist_ok=True)
+            fd = os.open(event_path, _OPEN_FLAGS, 0o644)
+        handles[file_key] = fd
+        if len(handles) > _MAX_OPEN_HANDLES:
+            _, oldest = handles.popitem(last=False)
+            os.close(oldest)
+        return fd
+
+    def _close_handles(self) -> None:
+        """Close every cached event file descriptor."""
+        with self._write_lock:
+            handles, self._handles = self._handles, OrderedDict()
+            for fd in handles.values():
+                try:
+                    os.close(fd)
+                except OSError as e:
+                    self.logger.error(f"Failed to close event file: {e}")
+
+    def _enqueue(self, writer: threading.Thread, item) -> bool:
+        """
+        Queue an item for the writer thread, waiting while the queue is full.
+
+        Args:
+            writer: Writer thread the item is meant for
+            item: _WriterItem, threading.Event or _STOP
+
+        Returns:
+            True once queued, False if the writer thread is no longer running
+        """
+        while writer.is_alive():
+            try:
+                self._queue.put(item, timeout=_WRITER_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _wait_for_writer(self) -> None:
+        """Block until the writer thread has written everything queued so far."""
+        writer = self._writer
+        if writer is None or not writer.is_alive():
+            return
+        written = threading.Event()
+        if not self._enqueue(writer, written):
+            self._drain_queue()
+            return
+        while not written.wait(_WRITER_POLL_SECONDS):
+            if not writer.is_alive():
+                # Stopped without reaching our marker: write the rest here
+                self._drain_queue()
+                return
+
+    def _write_batch(self, batch: List[_WriterItem]) -> None:
+        """
+        Append queued events, one write per event file.
+
+        Lines are grouped by event file, keeping their order. Errors are
+        logged rather than raised, so the writer thread keeps running.
+
+        Args:
+            batch: Queued items, in publish order
+        """
+        try:
+            with self._write_lock:
+                batch.sort(key=_batch_file_key)  # stable: keeps line order
+                for file_key, items in groupby(batch, key=_batch_file_key):
+                    items = list(items)
+                    if self.coalesce:
+                        lines = _coalesce_lines(items)
+                    else:
+                        lines = [item[1] for item in items]
+                    self._write_lines(
+                        file_key,
+                        lines,
+                        any(item[2] for item in items)
+                    )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to write {len(batch)} queued event(s): {e}",
+                exc_info=True
+            )
+
+    def _drain_queue(self) -> None:
+        """
+        Write items left in the queue once the writer thread has stopped.
+
+        Releases any sync() waiters found along the way.
+        """
+        batch: List[_WriterItem] = []
+        waiters: List[threading.Event] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                continue
+            if isinstance(item, threading.Event):
+                waiters.append(item)
+            else:
+                batch.append(item)
+
+        if batch:
+            self._write_batch(batch)
+        for written in waiters:
+            written.set()
+
+    def _drain_loop(self) -> None:
+        """
+        Writer thread: append queued events until _STOP is received.
+
+        Waits for a first item, then keeps collecting until batch_size lines
+        are pending, batch_ms has passed, or a sync/stop request arrives.
+        Collected lines are written with _write_batch(), which logs rather
+        than raises, so a failing batch does not stop the thread.
+        """
+        get = self._queue.get
+        interval = self.batch_ms / 1000
+        running = True
+
+        while running:
+            batch: List[_WriterItem] = []
+            waiters: List[threading.Event] = []
+
+            item = get()
+            deadline = time.monotonic() + interval
+            while True:
+                if item is _STOP:
+                    running = False
+                    break
+                if isinstance(item, threading.Event):
+                    waiters.append(item)
+                    break
+                batch.append(item)
+                if item[2] or len(batch) >= self.batch_size:
+                    break
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = get(timeout=timeout)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write_batch(batch)
+
+            for written in waiters:
+                written.set()
+
+    def sync(self, adw_id: Optional[str] = None) -> None:
+        """
+        Write pending (batched) events to the OS.
+
+        Args:
+            adw_id: Workflow to sync (None = every workflow)
+
+        Example:
+            >>> bus.publish(event)
+            >>> bus.sync("wf-001")  # events.jsonl now contains the event
+        """
+        # Writes are unbuffered os.write() calls, so only queued events (and
+        # events held back by rate limits) can be pending
+        self._flush_suppressed(adw_id)
+        self._wait_for_writer()
+
+    def rotate(
+        self,
+        adw_id: str,
+        max_bytes: int = 100 * 1024 * 1024
+    ) -> Optional[Path]:
+        """
+        Archive a workflow's event file once it exceeds max_bytes.
+
+        The event file is renamed into an archive/ subdirectory next to it
+        (archive/events-{UTC time}.jsonl[.zst]); the next event starts a new
+        file. The rename stays on the same filesystem, so no data is copied.
+        In aggregated mode the shared file (all workflows) is rotated.
+
+        Note:
+            read_events()/iter_events() only read the current file; archived
+            files are plain (or zstd-framed) JSONL and can be read directly.
 
         Args:
             adw_id: Workflow identifier
+            max_bytes: Rotate only if the file is larger than this
 
         Returns:
-            List of ADWEvent objects (in chronological order)
+            Path of the archived file, or None if not rotated
+
+        Example:
+            >>> archived = bus.rotate("wf-2025-001", max_bytes=10 * 1024 * 1024)
+        """
+        # Archive everything published so far
+        self.sync(adw_id)
+
+        file_key = self._file_key(adw_id)
+        event_file = self._event_file(file_key)
+
+        with self._write_lock:
+            try:
+                if event_file.stat().st_size <= max_bytes:
+                    return None
+            except FileNotFoundError:
+                return None
+
+            # Stop appending to the file being archived
+            fd = self._handles.pop(file_key, None)
+            if fd is not None:
+                os.close(fd)
+
+            archive_dir = event_file.parent / _ARCHIVE_DIR
+            archive_dir.mkdir(exist_ok=True)
+            stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime())
+            suffix = "".join(event_file.suffixes)
+            archive_file = archive_dir / f"events-{stamp}{suffix}"
+            counter = 1
+            while archive_file.exists():
+                archive_file = archive_dir / f"events-{stamp}-{counter}{suffix}"
+                counter += 1
+
+            os.replace(event_file, archive_file)
+
+        self.logger.info(f"Rotated {event_file} to {archive_file}")
+        return archive_file
+
+    def close(self) -> None:
+        """
+        Close event bus, writing any queued events first.
+
+        Cleanup:
+        - Waits for handlers and clears subscribers (BaseEventBus.close)
+        - Writes events held back by rate limits
+        - Stops the writer thread once queued events are written (batching)
+        - Closes cached event files
+        """
+        super().close()
+
+        self._flush_suppressed()
+
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            self._enqueue(writer, _STOP)
+            writer.join()
+            # Events queued by publishers that raced with close
+            self._drain_queue()
+
+        self._close_handles()
+
+    def iter_events(self, adw_id: str) -> Iterator[ADWEvent]:
+        """
+        Stream events for workflow from file, one line at a time.
+
+        Unlike read_events(), only the current event is held in memory, so
+        arbitrarily long event logs can be scanned in O(1) memory.
+
+        Args:
+            adw_id: Workflow identifier
+
+        Yields:
+            ADWEvent objects (in chronological order)
 
         Error Handling:
-        - If file doesn't exist: return empty list
+        - If file doesn't exist: yield nothing
         - If line fails to parse: log warning, skip line, continue
 
         Example:
             >>> bus = FileEventBus()
-            >>> events = bus.read_events("wf-2025-001")
-            >>> for event in events:
+            >>> for event in bus.iter_events("wf-2025-001"):
             ...     print(f"{event.timestamp}: {event.event_type}")
         """
-        event_file = self.base_dir / adw_id / "events.jsonl"
+        for event_file, line_num, line in self._iter_lines(adw_id):
+            try:
+                # The JSON parser accepts the trailing newline as-is
+                event = ADWEvent.from_jsonl(line)
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to parse event on line {line_num} in {event_file}: {e}"
+                )
+                # Skip malformed line, continue parsing
+                continue
+            yield event
+
+    def iter_events_filtered(
+        self,
+        adw_id: str,
+        event_filter: EventFilter
+    ) -> Iterator[ADWEvent]:
+        """
+        Stream only the events for workflow that match a filter.
+
+        Each line is first decoded into a plain dict and checked with
+        EventFilter.matches_dict(); only matching lines are validated into
+        ADWEvent objects, so selective filters (e.g. errors only) skip most
+        of the model construction cost.
+
+        Args:
+            adw_id: Workflow identifier
+            event_filter: Criteria events must match
+
+        Yields:
+            Matching ADWEvent objects (in chronological order)
+
+        Error Handling:
+        - If file doesn't exist: yield nothing
+        - If line fails to parse: log warning, skip line, continue
+
+        Example:
+            >>> errors = EventFilter(severities=[EventSeverity.ERROR])
+            >>> for event in bus.iter_events_filtered("wf-2025-001", errors):
+            ...     print(event.message)
+        """
+        for event_file, line_num, line in self._iter_lines(adw_id):
+            try:
+                raw = from_json(line)
+                if not event_filter.matches_dict(raw):
+                    continue
+                event = ADWEvent.model_validate(raw)
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to parse event on line {line_num} in {event_file}: {e}"
+                )
+                # Skip malformed line, continue parsing
+                continue
+            yield event
+
+    def _iter_lines(self, adw_id: str) -> Iterator[Tuple[Path, int, bytes]]:
+        """
+        Stream the raw JSONL lines of a workflow's events.
+
+        Args:
+            adw_id: Workflow identifier
+
+        Yields:
+            Tuples of (event file, 1-based line number, line bytes)
+        """
+        # Make queued events for this workflow visible to the read
+        self.sync(adw_id)
+
+        event_file = self._event_file(self._file_key(adw_id))
 
         if not event_file.exists():
+            self.logger.debug(f"No event file for {adw_id}")
+            return
+
+        prefix = self._line_prefix(adw_id)
+
+        # Binary read: lines go to the JSON parser as bytes, no text decode
+        with open(event_file, "rb") as f:
+            lines = f
+            if self._compressor is not None:
+                lines = io.BufferedReader(
+                    zstandard.ZstdDecompressor().stream_reader(
+                        f, read_across_frames=True
+                    )
+                )
+            try:
+                for line_num, line in enumerate(lines, start=1):
+                    if prefix is not None and not line.startswith(prefix):
+                        continue
+                    if line.isspace():
+                        # Blank line (no allocation, unlike strip())
+                        continue
+                    yield event_file, line_num, line
+            except _ZSTD_ERRORS as e:
+                # Truncated last frame (e.g. crash mid-write); keep what was read
+                self.logger.warning(f"Corrupt compressed data in {event_file}: {e}")
+
+    def _line_prefix(self, adw_id: str) -> Optional[bytes]:
+        """
+        Prefix of a workflow's lines in the shared (aggregated) event file.
+
+        Lines start with the serialized workflow_id (always the first key
+        written), so other workflows' lines can be skipped without parsing.
+
+        Args:
+            adw_id: Workflow identifier
+
+        Returns:
+            Line prefix, or None if the event file is per workflow
+        """
+        if not self.aggregated:
+            return None
+        return b'{"workflow_id":' + to_json(adw_id) + b","
+
+    def read_events_parallel(
+        self,
+        adw_id: str,
+        workers: Optional[int] = None
+    ) -> List[ADWEvent]:
+        """
+        Read all events for workflow, parsing the file on several CPU cores.
+
+        The event file is memory-mapped and split into one block of whole
+        lines per worker; blocks are parsed in a process pool and merged in
+        file order. Intended for large audit/analysis reads; event files
+        under _PARALLEL_MIN_BYTES (or workers <= 1) are read serially.
+
+        Args:
+            adw_id: Workflow identifier
+            workers: Worker processes (default: os.cpu_count())
+
+        Returns:
+            List of ADWEvent objects (in chronological order)
+
+        Error Handling:
+        - If file doesn't exist: return empty list
+        - If line fails to parse: log warning, skip line, continue
+
+        Example:
+            >>> bus = FileEventBus()
+            >>> events = bus.read_events_parallel("wf-2025-001", workers=8)
+        """
+        workers = workers or os.cpu_count() or 1
+
+        # Make queued events for this workflow visible to the read
+        self.sync(adw_id)
+
+        event_file = self._event_file(self._file_key(adw_id))
+
+        try:
+            size = event_file.stat().st_size
+        except FileNotFoundError:
             self.logger.debug(f"No event file for {adw_id}")
             return []
 
-        events = []
-        with open(event_file, "r", encoding="utf-8") as f:
-            for line_num, line in enumerate(f, start=1):
-                try:
-                    event = ADWEvent.from_jsonl(line.strip())
-                    events.append(event)
-                except Exception as e:
+        if workers <= 1 or size < _PARALLEL_MIN_BYTES or self._compressor:
+            return self.read_events(adw_id)
+
+        prefix = self._line_prefix(adw_id)
+        events: List[ADWEvent] = []
+
+        with open(event_file, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                ProcessPoolExecutor(max_workers=workers) as executor:
+            # Block boundaries: just past the first newline after each
+            # equal split point, so no line straddles two blocks
+            bounds = [0]
+            for i in range(1, workers):
+                end = mm.find(b"\n", max(bounds[-1], i * size // workers))
+                if end == -1:
+                    break
+                bounds.append(end + 1)
+            bounds.append(size)
+
+            futures = [
+                executor.submit(_parse_chunk, mm[start:end], prefix)
+                for start, end in zip(bounds, bounds[1:])
+                if start < end
+            ]
+
+            line_offset = 1
+            for future in futures:
+                chunk_events, errors, line_count = future.result()
+                events.extend(chunk_events)
+                for index, error in errors:
                     self.logger.warning(
-                        f"Failed to parse event on line {line_num} in {event_file}: {e}"
+                        f"Failed to parse event on line {line_offset + index} "
+                        f"in {event_file}: {error}"
                     )
-                    # Skip malformed line, continue parsing
+                line_offset += line_count
 
         self.logger.info(f"Read {len(events)} events for {adw_id}")
         return events
 
+    def read_events(self, adw_id: str) -> List[ADWEvent]:
+        """
+        Read all events for workflow from file.
+
+        Args:
+            adw_id: Workflow identifier
+
+        Returns:
+            List of ADWEvent objects (in chronological order)
+
+        Error Handling:
+        - If file doesn't exist: return empty list
+        - If line fails to parse: log warning, skip line, continue
+
+        Example:
+            >>> bus = FileEventBus()
+            >>> events = bus.read_events("wf-2025-001")
+            >>> for event in events:
+            ...     print(f"{event.timestamp}: {event.event_type}")
+        """
+        events = list(self.iter_events(adw_id))
+        self.logger.info(f"Read {len(events)} events for {adw_id}")
+        return events
+
     def replay_events(
         self,
         adw_id: str,
@@ -189,9 +1191,8 @@ class FileEventBus(BaseEventBus):
             >>> bus = FileEventBus()
             >>> bus.replay_events("wf-2025-001", print_handler)
         """
-        events = self.read_events(adw_id)
-
-        for event in events:
+        # Stream from the file rather than loading every event first
+        for event in self.iter_events(adw_id):
             try:
                 handler(event)
             except Exception as e:
@@ -6,7 +6,7 @@ This module provides:
 - BaseEventBus: Base class with common subscriber management and routing logic
 """
 
-from typing import Protocol, Callable, Optional, Dict
+from typing import Protocol, Callable, Optional, Dict, List, Tuple
 from adws.events.models import ADWEvent
 from adws.events.filters import EventFilter
 import uuid
@@ -16,11 +16,104 @@ import threading
 import time
 import inspect
 from abc import abstractmethod
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from concurrent.futures import Executor, ThreadPoolExecutor
 
 
 logger = logging.getLogger(__name__)
 
+# Registered subscriber:
+# (subscription ID, handler, filter, handler is async, run sync handler inline)
+_Subscriber = Tuple[str, Callable, Optional[EventFilter], bool, bool]
+
+# Publish routing: (subscribers by event type, subscribers for any other type,
+# cache of subscribers by (event_type, adw_id, severity)); type-indexed
+# entries carry the filter minus its event_types, cached entries only the
+# sources check (None if nothing is left)
+_Routes = Tuple[
+    Dict[str, Tuple[_Subscriber, ...]],
+    Tuple[_Subscriber, ...],
+    Dict[Tuple[str, str, str], Tuple[_Subscriber, ...]],
+]
+
+# Most (event_type, adw_id, severity) routes cached before the cache is reset
+_ROUTE_CACHE_SIZE = 1024
+
+
+def _build_routes(subs: Tuple[_Subscriber, ...]) -> _Routes:
+    """
+    Index subscribers by the event types their filters accept.
+
+    Args:
+        subs: Subscribers in subscription order
+
+    Returns:
+        Routes where each event type maps to every subscriber that can
+        receive it (in subscription order), with the event type check
+        already applied
+    """
+    def residual(event_filter: Optional[EventFilter]) -> Optional[EventFilter]:
+        if event_filter is None:
+            return None
+        if not (event_filter.adw_ids or event_filter.severities or event_filter.sources):
+            return None
+        return replace(event_filter, event_types=None)
+
+    wildcard = tuple(
+        (sub_id, handler, residual(event_filter), is_coro, fast)
+        for sub_id, handler, event_filter, is_coro, fast in subs
+        if not (event_filter and event_filter.event_types)
+    )
+
+    event_types = {
+        event_type
+        for _, _, event_filter, _, _ in subs
+        if event_filter and event_filter.event_types
+        for event_type in event_filter.event_types
+    }
+    by_type = {
+        getattr(event_type, "value", event_type): tuple(
+            (sub_id, handler, residual(event_filter), is_coro, fast)
+            for sub_id, handler, event_filter, is_coro, fast in subs
+            if not (event_filter and event_filter.event_types)
+            or event_type in event_filter.event_types
+        )
+        for event_type in event_types
+    }
+    return by_type, wildcard, {}
+
+
+def _select_routes(
+    subs: Tuple[_Subscriber, ...],
+    adw_id: str,
+    severity: str
+) -> Tuple[_Subscriber, ...]:
+    """
+    Narrow type-indexed subscribers to those accepting a workflow and severity.
+
+    Args:
+        subs: Subscribers for one event type (filters without event_types)
+        adw_id: Event workflow ID
+        severity: Event severity
+
+    Returns:
+        Matching subscribers, whose filters are reduced to the sources
+        check (None when the filter has no sources)
+    """
+    selected = []
+    for sub_id, handler, event_filter, is_coro, fast in subs:
+        if event_filter is not None:
+            if event_filter.adw_ids and adw_id not in event_filter.adw_ids:
+                continue
+            if event_filter.severities and severity not in event_filter.severities:
+                continue
+            event_filter = (
+                EventFilter(sources=event_filter.sources)
+                if event_filter.sources else None
+            )
+        selected.append((sub_id, handler, event_filter, is_coro, fast))
+    return tuple(selected)
+
 
 class EventBus(Protocol):
     """
@@ -81,7 +174,8 @@ class EventBus(Protocol):
     def subscribe(
         self,
         handler: Callable[[ADWEvent], None],
-        event_filter: Optional[EventFilter] = None
+        event_filter: Optional[EventFilter] = None,
+        fast: bool = False
     ) -> str:
         """
         Subscribe to events with optional filtering.
@@ -89,6 +183,8 @@ class EventBus(Protocol):
         Args:
             handler: Callback function to handle matching events
             event_filter: Optional filter (None = receive all events)
+            fast: Handler is short (well under a millisecond): run it inline
+                on the publishing thread instead of the thread pool
 
         Returns:
             Subscription ID (UUID) for unsubscribing
@@ -159,12 +255,24 @@ class BaseEventBus:
     - _publish_to_backend(event): Backend-specific event persistence/streaming
 
     Thread Safety:
-    - All subscriber operations are protected with threading.RLock()
-    - Publish operations use copy-on-write to avoid holding locks during handler execution
+    - Subscribers are stored in an immutable tuple; subscribe/unsubscribe
+      build a new tuple under a writer lock and swap it in (copy-on-write)
+    - Publish reads the current tuple with a single attribute load: no lock,
+      no copy, and no lock held during handler execution
+
+    Routing:
+    - Subscribers are indexed by the event types their filters accept, and
+      the subscribers for each (event_type, adw_id, severity) seen are
+      cached, so publish only visits subscribers that can receive the event
+      and skips those checks (filters are read at subscribe time)
+    - Events with no subscribers skip dispatch entirely, and skip the
+      backend too when _needs_backend() returns False
 
     Handler Execution:
     - Async handlers (coroutine functions) are dispatched via asyncio.create_task()
     - Sync handlers are dispatched via ThreadPoolExecutor to avoid blocking
+    - Sync handlers subscribed with fast=True run inline on the publishing
+      thread (no executor submit/Future), for handlers cheaper than a hand-off
     - Handler errors are logged with execution metrics
 
     Usage:
@@ -174,27 +282,56 @@ class BaseEventBus:
                 pass
     """
 
-    def __init__(self, max_workers: int = 10):
+    def __init__(self, max_workers: int = 10, executor: Optional[Executor] = None):
         """
         Initialize base event bus with empty subscriber registry.
 
         Args:
             max_workers: Maximum thread pool workers for sync handler dispatch.
                         Default is 10. Set to 0 to disable thread pool (handlers run inline).
+            executor: Executor for sync handler dispatch, instead of the bus's own
+                        ThreadPoolExecutor (max_workers is then ignored). The caller
+                        owns it: close() does not shut it down, so one executor can be
+                        shared by several buses or with the application (e.g. the
+                        event loop's default executor when running under uvloop).
         """
-        self.subscribers: Dict[str, tuple[Callable, Optional[EventFilter]]] = {}
+        self._subs: Tuple[_Subscriber, ...] = ()
+        self._routes: _Routes = ({}, (), {})
         self.logger = logging.getLogger(self.__class__.__name__)
-        self._lock = threading.RLock()
-        self._executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+        # Writers only (subscribe/unsubscribe/close): publishers never lock,
+        # they read the current copy-on-write snapshot
+        self._lock = threading.Lock()
+        if executor is not None:
+            self._executor: Optional[Executor] = executor
+            self._owns_executor = False
+        else:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers) if max_workers > 0 else None
+            self._owns_executor = True
         self._max_workers = max_workers
         self._background_tasks: set = set()  # Track async tasks for cleanup
 
+    @property
+    def subscribers(self) -> Dict[str, Tuple[Callable, Optional[EventFilter]]]:
+        """
+        Current subscriptions as {subscription ID: (handler, filter)}.
+
+        Returns:
+            A new dict built from the subscriber tuple (modifying it does
+            not change subscriptions; use subscribe()/unsubscribe())
+        """
+        return {
+            sub_id: (handler, event_filter)
+            for sub_id, handler, event_filter, _, _ in self._subs
+        }
+
     def publish(self, event: ADWEvent) -> None:
         """
         Publish event to all matching subscribers.
 
         Algorithm:
-            1. Take snapshot of subscribers (copy-on-write with lock)
+            1. Take snapshot of the subscribers for the event's type (the
+               current immutable routing index); if there are none and no
+               backend work is needed, return
             2. For each subscriber:
                a. Apply event filter (if any)
                b. If event matches filter, dispatch handler asynchronously
@@ -202,30 +339,67 @@ class BaseEventBus:
             3. Call _publish_to_backend() for persistence/streaming
 
         Thread Safety:
-        - Uses lock to create snapshot of subscribers
-        - Handlers execute outside lock to prevent deadlock
+        - Reads the subscriber tuple without locking (it is never mutated)
+        - Handlers execute outside any lock to prevent deadlock
 
         Handler Dispatch:
-        - Async handlers (coroutine functions) → asyncio.create_task() if event loop available
-        - Sync handlers → ThreadPoolExecutor.submit() for non-blocking execution
-        - Fallback to inline execution if no executor or event loop
+        - Async handlers (coroutine functions) → loop.create_task() if an event
+          loop is running, otherwise skipped with a warning
+        - Fast sync handlers (subscribed with fast=True) → run inline
+        - Other sync handlers → executor.submit() for non-blocking execution
+        - Fallback to inline execution if no executor
+        - The executor and running loop are looked up once per event
 
         Error Handling:
         - Subscriber errors are logged with execution metrics
         - Backend errors are logged but don't affect subscribers
         """
-        # Copy-on-write: snapshot subscribers while holding lock
-        with self._lock:
-            subscribers_snapshot = dict(self.subscribers)
+        # Copy-on-write: the routes are replaced on subscribe/unsubscribe, so
+        # a single read is a consistent snapshot
+        subs = self._route(event)
+        if not subs and not self._needs_backend(event):
+            return
+
+        # Per-event invariants, resolved once rather than per subscriber
+        executor = self._executor
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
 
-        # Route to subscribers (outside lock to prevent deadlock)
-        for sub_id, (handler, event_filter) in subscribers_snapshot.items():
-            # Apply filter
+        for sub_id, handler, event_filter, is_coro, fast in subs:
+            # Apply remaining filter criteria (event type already matched)
             if event_filter and not event_filter.matches(event):
                 continue
 
-            # Dispatch handler with metrics
-            self._dispatch_handler(sub_id, handler, event)
+            start_time = time.perf_counter_ns()
+            try:
+                if is_coro:
+                    if loop is None:
+                        self.logger.warning(
+                            f"Async handler {sub_id} skipped (no event loop running). "
+                            f"Use publish_async() for async handlers."
+                        )
+                        continue
+                    # Schedule async handler as task, tracked for
+                    # wait_for_pending_tasks()
+                    task = loop.create_task(
+                        self._execute_async_handler(sub_id, handler, event, start_time)
+                    )
+                    self._background_tasks.add(task)
+                    task.add_done_callback(self._background_tasks.discard)
+                elif executor and not fast:
+                    executor.submit(self._execute_sync_handler, sub_id, handler, event, start_time)
+                else:
+                    # Fast handler or no executor: run inline
+                    self._execute_sync_handler(sub_id, handler, event, start_time)
+            except Exception as e:
+                duration_ms = (time.perf_counter_ns() - start_time) / 1e6
+                self.logger.error(
+                    f"Handler dispatch error for {sub_id} ({event.event_type}): {e} "
+                    f"[duration: {duration_ms:.2f}ms]",
+                    exc_info=True
+                )
 
         # Backend-specific publication (file write, socket send, queue push)
         try:
@@ -237,96 +411,93 @@ class BaseEventBus:
             )
             # Don't propagate backend errors to workflow
 
-    def _dispatch_handler(self, sub_id: str, handler: Callable, event: ADWEvent) -> None:
+    def _execute_sync_handler(self, sub_id: str, handler: Callable, event: ADWEvent, start_time: int) -> None:
         """
-        Dispatch handler with appropriate execution strategy.
-
-        Strategy:
-        1. If handler is coroutine function AND event loop is running:
-           → asyncio.create_task() for async execution
-        2. Else if ThreadPoolExecutor is available:
-           → executor.submit() for non-blocking execution
-        3. Else:
-           → Inline execution (synchronous fallback)
-
-        Args:
-            sub_id: Subscription ID for logging
-            handler: Handler callable
-            event: Event to pass to handler
+        Execute synchronous handler with error handling and metrics.
 
-        Metrics:
-        - Logs execution time and any errors
+        start_time is a time.perf_counter_ns() reading; the success metric
+        is only computed and formatted when debug logging is enabled.
         """
-        start_time = time.time()
-
-        try:
-            # Check if handler is async coroutine function
-            if inspect.iscoroutinefunction(handler):
-                # Try to get running event loop
-                try:
-                    asyncio.get_running_loop()
-                    # Schedule async handler as task
-                    asyncio.create_task(
-                        self._execute_async_handler(sub_id, handler, event, start_time)
-                    )
-                    return  # Task scheduled, don't wait
-                except RuntimeError:
-                    # No event loop running, log warning and skip
-                    self.logger.warning(
-                        f"Async handler {sub_id} skipped (no event loop running). "
-                        f"Use publish_async() for async handlers."
-                    )
-                    return
-
-            # Sync handler: dispatch via thread pool if available
-            if self._executor:
-                self._executor.submit(self._execute_sync_handler, sub_id, handler, event, start_time)
-            else:
-                # Inline execution (fallback)
-                self._execute_sync_handler(sub_id, handler, event, start_time)
-
-        except Exception as e:
-            duration = time.time() - start_time
-            self.logger.error(
-                f"Handler dispatch error for {sub_id} ({event.event_type}): {e} "
-                f"[duration: {duration*1000:.2f}ms]",
-                exc_info=True
-            )
-
-    def _execute_sync_handler(self, sub_id: str, handler: Callable, event: ADWEvent, start_time: float) -> None:
-        """Execute synchronous handler with error handling and metrics."""
         try:
             handler(event)
-            duration = time.time() - start_time
-            self.logger.debug(
-                f"Handler {sub_id} executed successfully for {event.event_type} "
-                f"[duration: {duration*1000:.2f}ms]"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Handler %s executed successfully for %s [duration: %.2fms]",
+                    sub_id, event.event_type,
+                    (time.perf_counter_ns() - start_time) / 1e6
+                )
         except Exception as e:
-            duration = time.time() - start_time
+            duration_ms = (time.perf_counter_ns() - start_time) / 1e6
             self.logger.error(
                 f"Subscriber {sub_id} error handling {event.event_type}: {e} "
-                f"[duration: {duration*1000:.2f}ms]",
+                f"[duration: {duration_ms:.2f}ms]",
                 exc_info=True
             )
 
-    async def _execute_async_handler(self, sub_id: str, handler: Callable, event: ADWEvent, start_time: float) -> None:
-        """Execute asynchronous handler with error handling and metrics."""
+    async def _execute_async_handler(self, sub_id: str, handler: Callable, event: ADWEvent, start_time: int) -> None:
+        """
+        Execute asynchronous handler with error handling and metrics.
+
+        start_time is a time.perf_counter_ns() reading; the success metric
+        is only computed and formatted when debug logging is enabled.
+        """
         try:
             await handler(event)
-            duration = time.time() - start_time
-            self.logger.debug(
-                f"Async handler {sub_id} executed successfully for {event.event_type} "
-                f"[duration: {duration*1000:.2f}ms]"
-            )
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(
+                    "Async handler %s executed successfully for %s [duration: %.2fms]",
+                    sub_id, event.event_type,
+                    (time.perf_counter_ns() - start_time) / 1e6
+                )
         except Exception as e:
-            duration = time.time() - start_time
+            duration_ms = (time.perf_counter_ns() - start_time) / 1e6
             self.logger.error(
                 f"Async subscriber {sub_id} error handling {event.event_type}: {e} "
-                f"[duration: {duration*1000:.2f}ms]",
+                f"[duration: {duration_ms:.2f}ms]",
                 exc_info=True
             )
 
+    def _route(self, event: ADWEvent) -> Tuple[_Subscriber, ...]:
+        """
+        Subscribers that can receive an event (routing snapshot, no lock).
+
+        Args:
+            event: Event being published
+
+        Returns:
+            Subscribers whose filters accept the event's type, workflow, and
+            severity, in subscription order (filters reduced to sources)
+        """
+        by_type, wildcard, cache = self._routes
+        key = (event.event_type, event.adw_id, event.severity)
+        subs = cache.get(key)
+        if subs is None:
+            subs = _select_routes(
+                by_type.get(event.event_type, wildcard),
+                event.adw_id,
+                event.severity
+            )
+            # Bounded: workflow IDs keep arriving in long-lived processes
+            if len(cache) >= _ROUTE_CACHE_SIZE:
+                cache.clear()
+            cache[key] = subs
+        return subs
+
+    def _needs_backend(self, event: ADWEvent) -> bool:
+        """
+        Whether an event must reach _publish_to_backend().
+
+        Subclasses used only for in-process fan-out can return False so
+        events nobody subscribed to are dropped without any work.
+
+        Args:
+            event: Event being published
+
+        Returns:
+            True (default): every event goes to the backend
+        """
+        return True
+
     @abstractmethod
     def _publish_to_backend(self, event: ADWEvent) -> None:
         """
@@ -347,7 +518,8 @@ class BaseEventBus:
     def subscribe(
         self,
         handler: Callable[[ADWEvent], None],
-        event_filter: Optional[EventFilter] = None
+        event_filter: Optional[EventFilter] = None,
+        fast: bool = False
     ) -> str:
         """
         Subscribe to events (thread-safe).
@@ -355,19 +527,29 @@ class BaseEventBus:
         Args:
             handler: Callable to handle events (sync or async coroutine function)
             event_filter: Optional filter for event matching
+            fast: Run a sync handler inline on the publishing thread instead
+                of the thread pool (for short handlers; a slow fast handler
+                delays publish). Ignored for async handlers.
 
         Returns:
             UUID subscription ID
 
         Thread Safety:
-        - Uses lock to protect subscriber registration
+        - Uses lock to serialize writers; publishers see the new tuple
+          (copy-on-write) without locking
         """
         sub_id = str(uuid.uuid4())
+        # Resolved once here rather than on every dispatch
+        is_coro = inspect.iscoroutinefunction(handler)
 
         with self._lock:
-            self.subscribers[sub_id] = (handler, event_filter)
+            self._subs = self._subs + ((sub_id, handler, event_filter, is_coro, fast),)
+            self._routes = _build_routes(self._subs)
+            if event_filter is not None:
+                # Routes hold copies of the filter; rebuild them if it changes
+                event_filter._add_listener(self._rebuild_routes)
 
-        handler_type = "async" if inspect.iscoroutinefunction(handler) else "sync"
+        handler_type = "async" if is_coro else ("fast sync" if fast else "sync")
         self.logger.info(
             f"Subscriber {sub_id} registered "
             f"(type: {handler_type}, filter: {event_filter is not None})"
@@ -382,54 +564,81 @@ class BaseEventBus:
             subscription_id: ID returned by subscribe()
 
         Thread Safety:
-        - Uses lock to protect subscriber removal
+        - Uses lock to serialize writers; publishers see the new tuple
+          (copy-on-write) without locking
         """
         with self._lock:
-            if subscription_id in self.subscribers:
-                self.subscribers.pop(subscription_id)
+            subs = tuple(sub for sub in self._subs if sub[0] != subscription_id)
+            if len(subs) != len(self._subs):
+                for sub in self._subs:
+                    if sub[0] == subscription_id and sub[2] is not None:
+                        sub[2]._remove_listener(self._rebuild_routes)
+                self._subs = subs
+                self._routes = _build_routes(subs)
                 self.logger.info(f"Subscriber {subscription_id} unregistered")
 
+    def _rebuild_routes(self) -> None:
+        """Rebuild routing after a subscribed filter's criteria were reassigned."""
+        with self._lock:
+            self._routes = _build_routes(self._subs)
+
     async def publish_async(self, event: ADWEvent) -> None:
         """
         Publish event asynchronously and wait for all handlers to complete.
 
         This method properly handles both sync and async handlers:
-        - Async handlers are awaited directly
-        - Sync handlers are dispatched via the bus's thread pool executor
+        - Async handlers are awaited directly (gathered concurrently)
+        - Sync handlers are run one after another in a single job on the
+          bus's thread pool executor (fast=True handlers run inline)
         - Backend publication is done in thread pool
         - Waits for all handler and backend work before returning
 
         Thread Safety:
-        - Uses same lock-based copy-on-write as sync publish()
+        - Reads the copy-on-write subscriber tuple, like sync publish()
         - Sync handlers use the bus's ThreadPoolExecutor (respects max_workers)
 
         Args:
             event: Event to publish
         """
-        # Copy-on-write: snapshot subscribers while holding lock
-        with self._lock:
-            subscribers_snapshot = dict(self.subscribers)
+        # Route to subscribers (copy-on-write routing snapshot, no lock)
+        subs = self._route(event)
+        if not subs and not self._needs_backend(event):
+            return
+
+        executor = self._executor
+        start_time = time.perf_counter_ns()
 
-        # Collect all handler tasks
-        handler_tasks = []
+        # Async handler coroutines, plus one executor job for all sync handlers
+        pending = []
+        sync_batch: List[Tuple[str, Callable]] = []
 
-        # Route to subscribers (outside lock to prevent deadlock)
-        for sub_id, (handler, event_filter) in subscribers_snapshot.items():
-            # Apply filter
+        for sub_id, handler, event_filter, is_coro, fast in subs:
+            # Apply remaining filter criteria (event type already matched)
             if event_filter and not event_filter.matches(event):
                 continue
 
-            # Create handler task (will be awaited)
-            task = asyncio.create_task(self._dispatch_handler_async(sub_id, handler, event))
-            handler_tasks.append(task)
+            if is_coro:
+                pending.append(
+                    self._execute_async_handler(sub_id, handler, event, start_time)
+                )
+            elif fast or executor is None:
+                # Fast sync handler (or no executor): run inline, no hand-off
+                self._execute_sync_handler(
+                    sub_id, handler, event, time.perf_counter_ns()
+                )
+            else:
+                sync_batch.append((sub_id, handler))
 
-            # Track task for cleanup
-            self._background_tasks.add(task)
-            task.add_done_callback(self._background_tasks.discard)
+        if sync_batch:
+            pending.append(
+                asyncio.get_running_loop().run_in_executor(
+                    executor, self._execute_sync_batch, sync_batch, event
+                )
+            )
 
         # Wait for all handlers to complete
-        if handler_tasks:
-            await asyncio.gather(*handler_tasks, return_exceptions=True)
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
 
         # Backend-specific publication (in thread pool)
         try:
@@ -441,54 +650,20 @@ class BaseEventBus:
             )
             # Don't propagate backend errors to workflow
 
-    async def _dispatch_handler_async(self, sub_id: str, handler: Callable, event: ADWEvent) -> None:
+    def _execute_sync_batch(
+        self,
+        handlers: List[Tuple[str, Callable]],
+        event: ADWEvent
+    ) -> None:
         """
-        Dispatch handler asynchronously (for use in async context).
-
-        Strategy:
-        1. If handler is coroutine function:
-           → await it directly
-        2. Else (sync handler):
-           → run in bus's thread pool via loop.run_in_executor()
+        Run sync handlers one after another (a single executor job).
 
         Args:
-            sub_id: Subscription ID for logging
-            handler: Handler callable
-            event: Event to pass to handler
-
-        Metrics:
-        - Logs execution time and any errors
-
-        Thread Pool:
-        - Sync handlers use the bus's ThreadPoolExecutor (respects max_workers)
+            handlers: (subscription ID, handler) pairs
+            event: Event to pass to each handler
         """
-        start_time = time.time()
-
-        try:
-            # Check if handler is async coroutine function
-            if inspect.iscoroutinefunction(handler):
-                # Await async handler directly
-                await self._execute_async_handler(sub_id, handler, event, start_time)
-            else:
-                # Run sync handler in bus's thread pool (respects max_workers)
-                if self._executor:
-                    loop = asyncio.get_running_loop()
-                    await loop.run_in_executor(
-                        self._executor,
-                        self._execute_sync_handler,
-                        sub_id, handler, event, start_time
-                    )
-                else:
-                    # No executor, run inline
-                    self._execute_sync_handler(sub_id, handler, event, start_time)
-
-        except Exception as e:
-            duration = time.time() - start_time
-            self.logger.error(
-                f"Handler dispatch error for {sub_id} ({event.event_type}): {e} "
-                f"[duration: {duration*1000:.2f}ms]",
-                exc_info=True
-            )
+        for sub_id, handler in handlers:
+            self._execute_sync_handler(sub_id, handler, event, time.perf_counter_ns())
 
     async def wait_for_pending_tasks(self, timeout: Optional[float] = None) -> bool:
         """
@@ -527,7 +702,8 @@ class BaseEventBus:
 
         Cleanup:
         - Clears all subscribers
-        - Shuts down ThreadPoolExecutor (waits for pending sync handlers)
+        - Shuts down the bus's own ThreadPoolExecutor (waits for pending sync
+          handlers); an executor passed to __init__ is left running
         - Subclasses should override to add backend-specific cleanup
 
         Thread Safety:
@@ -539,13 +715,17 @@ class BaseEventBus:
         - For async cleanup, consider using async with bus: pattern in future.
         """
         with self._lock:
-            self.subscribers.clear()
+            for _, _, event_filter, _, _ in self._subs:
+                if event_filter is not None:
+                    event_filter._remove_listener(self._rebuild_routes)
+            self._subs = ()
+            self._routes = ({}, (), {})
 
         # Shutdown executor and wait for pending sync handlers
-        if self._executor:
+        if self._executor and self._owns_executor:
             self.logger.info("Shutting down handler thread pool...")
             self._executor.shutdown(wait=True)
-            self._executor = None
+        self._executor = None
 
         # Log warning if async tasks are still pending
         if self._background_tasks:
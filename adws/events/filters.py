@@ -5,11 +5,28 @@ This module provides the EventFilter class for filtering events based on
 multiple criteria: event types, workflow IDs, severity levels, and sources.
 """
 
+import weakref
 from dataclasses import dataclass
-from typing import Optional, List
+from operator import attrgetter
+from typing import Any, Callable, Dict, FrozenSet, Optional, List, Tuple
 from adws.events.models import ADWEvent, EventType, EventSeverity
 
 
+# Filter criteria: (EventFilter field, ADWEvent attribute, serialized key)
+_CRITERIA = (
+    ("event_types", "event_type", "event_type"),
+    ("adw_ids", "adw_id", "workflow_id"),
+    ("severities", "severity", "severity"),
+    ("sources", "source", "source"),
+)
+_CRITERIA_FIELDS = frozenset(field for field, _, _ in _CRITERIA)
+
+
+def _match_all(event: ADWEvent) -> bool:
+    """Predicate for a filter without criteria."""
+    return True
+
+
 @dataclass
 class EventFilter:
     """
@@ -39,6 +56,13 @@ class EventFilter:
 
         # Subscribe to all events (no filter)
         filter = EventFilter()  # or just pass None to subscribe()
+
+    Performance:
+        The criteria are compiled into frozensets and a predicate that only
+        runs the active checks, whenever a criterion is assigned. Replace a
+        list (filter.sources = [...]) rather than mutating it in place.
+        Event buses a filter is subscribed to are notified of the change and
+        update their routing.
     """
 
     event_types: Optional[List[EventType]] = None
@@ -53,6 +77,73 @@ class EventFilter:
     sources: Optional[List[str]] = None
     """Filter by event source (match any in list)"""
 
+    def __post_init__(self):
+        self._compile()
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        # Recompile once all criteria exist (i.e. after dataclass __init__)
+        if name in _CRITERIA_FIELDS and "_predicate" in self.__dict__:
+            self._compile()
+
+    def _compile(self) -> None:
+        """Build the criteria sets and the match predicate."""
+        sets: Dict[str, Optional[FrozenSet]] = {
+            field: frozenset(getattr(self, field)) if getattr(self, field) else None
+            for field in _CRITERIA_FIELDS
+        }
+        checks: Tuple[Tuple[Callable, FrozenSet], ...] = tuple(
+            (attrgetter(attr), sets[field])
+            for field, attr, _ in _CRITERIA
+            if sets[field] is not None
+        )
+
+        if not checks:
+            predicate = _match_all
+        elif len(checks) == 1:
+            ((get, allowed),) = checks
+
+            def predicate(event: ADWEvent) -> bool:
+                return get(event) in allowed
+        else:
+            def predicate(event: ADWEvent) -> bool:
+                for get, allowed in checks:
+                    if get(event) not in allowed:
+                        return False
+                return True
+
+        object.__setattr__(self, "_sets", sets)
+        object.__setattr__(self, "_predicate", predicate)
+
+        for listener in tuple(self.__dict__.get("_listeners", ())):
+            callback = listener()
+            if callback is not None:
+                callback()
+
+    def _add_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Call a bound method whenever the criteria are reassigned.
+
+        The method is held weakly, so a filter never keeps an event bus alive.
+
+        Args:
+            callback: Bound method to call after recompiling
+        """
+        self.__dict__.setdefault("_listeners", []).append(weakref.WeakMethod(callback))
+
+    def _remove_listener(self, callback: Callable[[], None]) -> None:
+        """
+        Drop one registration of a callback added by _add_listener().
+
+        Args:
+            callback: Bound method passed to _add_listener()
+        """
+        listeners = self.__dict__.get("_listeners", [])
+        for index, listener in enumerate(listeners):
+            if listener() == callback:
+                del listeners[index]
+                return
+
     def matches(self, event: ADWEvent) -> bool:
         """
         Check if event matches filter criteria.
@@ -64,8 +155,8 @@ class EventFilter:
             True if event matches all specified criteria (AND logic)
 
         Algorithm:
-            For each non-None filter criterion:
-                If event field not in criterion list: return False
+            For each non-empty filter criterion (precompiled):
+                If event field not in criterion set: return False
             If all criteria passed: return True
 
         Examples:
@@ -76,25 +167,49 @@ class EventFilter:
             >>> event2 = ADWEvent(event_type=EventType.WORKFLOW_COMPLETED, ...)
             >>> filter.matches(event2)  # False
         """
-        # Check event_types filter
-        if self.event_types and len(self.event_types) > 0:
-            if event.event_type not in self.event_types:
-                return False
+        return self._predicate(event)
 
-        # Check adw_ids filter
-        if self.adw_ids and len(self.adw_ids) > 0:
-            if event.adw_id not in self.adw_ids:
-                return False
+    def matches_dict(self, data: Dict[str, Any]) -> bool:
+        """
+        Check if a raw (decoded JSONL) event matches filter criteria.
+
+        Same criteria as matches(), evaluated on the serialized fields of an
+        event, so events read from disk can be filtered before an ADWEvent
+        is constructed.
+
+        Args:
+            data: Event as decoded from a JSONL line (keys as serialized,
+                e.g. "workflow_id"; enum fields as their string values)
 
-        # Check severities filter
-        if self.severities and len(self.severities) > 0:
-            if event.severity not in self.severities:
+        Returns:
+            True if event matches all specified criteria (AND logic)
+
+        Examples:
+            >>> filter = EventFilter(severities=[EventSeverity.ERROR])
+            >>> filter.matches_dict({"workflow_id": "wf-001", "severity": "error"})
+            True
+        """
+        # str-based enums hash and compare equal to their values
+        sets = self._sets
+
+        event_types = sets["event_types"]
+        if event_types is not None and data.get("event_type") not in event_types:
+            return False
+
+        adw_ids = sets["adw_ids"]
+        if adw_ids is not None:
+            adw_id = data.get("workflow_id", data.get("adw_id"))
+            if adw_id not in adw_ids:
                 return False
 
-        # Check sources filter
-        if self.sources and len(self.sources) > 0:
-            if event.source not in self.sources:
+        severities = sets["severities"]
+        if severities is not None:
+            # Severity is optional in the model (defaults to info)
+            if data.get("severity", EventSeverity.INFO) not in severities:
                 return False
 
-        # All criteria passed
+        sources = sets["sources"]
+        if sources is not None and data.get("source") not in sources:
+            return False
+
         return True
@@ -15,7 +15,7 @@ Design Principles:
 
 from pydantic import BaseModel, Field, field_serializer, AliasChoices
 from datetime import datetime, timezone
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 from enum import Enum
 
 
@@ -221,13 +221,32 @@ class ADWEvent(BaseModel):
         # Use aliases so 'workflow_id' appears in serialized output
         return self.model_dump_json(by_alias=True)
 
+    def to_jsonl_bytes(self) -> bytes:
+        """
+        Serialize to a UTF-8 encoded JSONL line (no newline).
+
+        Same output as to_jsonl().encode(), produced directly as bytes by
+        pydantic-core without an intermediate str.
+
+        Returns:
+            UTF-8 JSON bytes representing event (no newline)
+
+        Example:
+            >>> with open("events.jsonl", "ab") as f:
+            ...     f.write(event.to_jsonl_bytes() + b"\\n")
+        """
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
+
     @classmethod
-    def from_jsonl(cls, line: str) -> "ADWEvent":
+    def from_jsonl(cls, line: Union[str, bytes]) -> "ADWEvent":
         """
         Deserialize from JSONL.
 
+        pydantic-core parses the JSON and validates in one pass; bytes read
+        from a binary file are parsed as-is, with no decode to str first.
+
         Args:
-            line: JSON string (single line from JSONL file)
+            line: JSON string or UTF-8 bytes (single line from JSONL file)
 
         Returns:
             ADWEvent instance
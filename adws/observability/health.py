@@ -25,12 +25,14 @@ Usage:
     return {"status": status.status, "components": status.components}
 """
 
+import logging
 import os
 import sqlite3
 import time
 from dataclasses import dataclass, field
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
 from adws.observability.logging import get_logger
 from adws.observability.metrics import set_gauge
@@ -393,12 +395,16 @@ def check_providers_health() -> ComponentHealth:
         )
 
 
-def check_health(
+def get_component_checks(
     db_path: Optional[Path] = None,
     event_bus_dir: Optional[Path] = None,
     workspace_dir: Optional[Path] = None,
-) -> HealthStatus:
-    """Check overall system health.
+) -> List[Callable[[], ComponentHealth]]:
+    """Return the per-component health checks as zero-argument callables.
+
+    Each check is independent, so callers running inside an event loop can
+    dispatch them to worker threads concurrently and pass the results to
+    `summarize_health`.
 
     Args:
         db_path: Optional database path (defaults to .adws/state/workflows.db)
@@ -406,27 +412,27 @@ def check_health(
         workspace_dir: Optional workspace directory (defaults to .adws)
 
     Returns:
-        HealthStatus with overall and component-level health
+        List of callables, one per component
+    """
+    return [
+        partial(check_database_health, db_path),
+        partial(check_eventbus_health, event_bus_dir),
+        partial(check_filesystem_health, workspace_dir),
+        check_providers_health,
+    ]
 
-    Example:
-        >>> status = check_health()
-        >>> if status.is_healthy:
-        ...     print("System healthy")
-        >>> else:
-        ...     for component in status.components:
-        ...         if not component.is_healthy:
-        ...             print(f"{component.name}: {component.message}")
+
+def summarize_health(components: List[ComponentHealth]) -> HealthStatus:
+    """Aggregate component results into an overall HealthStatus.
+
+    Args:
+        components: Results of the component health checks
+
+    Returns:
+        HealthStatus with overall and component-level health
     """
     from datetime import datetime, timezone
 
-    # Run all health checks
-    components = [
-        check_database_health(db_path),
-        check_eventbus_health(event_bus_dir),
-        check_filesystem_health(workspace_dir),
-        check_providers_health(),
-    ]
-
     # Determine overall status
     all_healthy = all(c.is_healthy for c in components)
     overall_status = "healthy" if all_healthy else "unhealthy"
@@ -444,17 +450,49 @@ def check_health(
         uptime_seconds=None,  # Could be enhanced to track actual uptime
     )
 
-    # Log health check result
-    logger.debug(
-        "health_check_completed",
-        status=overall_status,
-        components_count=len(components),
-        healthy_count=sum(1 for c in components if c.is_healthy),
-    )
+    # Log health check result (skip building kwargs when DEBUG is filtered)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "health_check_completed",
+            status=overall_status,
+            components_count=len(components),
+            healthy_count=sum(1 for c in components if c.is_healthy),
+        )
 
     return health_status
 
 
+def check_health(
+    db_path: Optional[Path] = None,
+    event_bus_dir: Optional[Path] = None,
+    workspace_dir: Optional[Path] = None,
+) -> HealthStatus:
+    """Check overall system health.
+
+    Args:
+        db_path: Optional database path (defaults to .adws/state/workflows.db)
+        event_bus_dir: Optional event bus directory (defaults to .adws)
+        workspace_dir: Optional workspace directory (defaults to .adws)
+
+    Returns:
+        HealthStatus with overall and component-level health
+
+    Example:
+        >>> status = check_health()
+        >>> if status.is_healthy:
+        ...     print("System healthy")
+        >>> else:
+        ...     for component in status.components:
+        ...         if not component.is_healthy:
+        ...             print(f"{component.name}: {component.message}")
+    """
+    # Run all health checks
+    components = [
+        check() for check in get_component_checks(db_path, event_bus_dir, workspace_dir)
+    ]
+    return summarize_health(components)
+
+
 def check_readiness(
     db_path: Optional[Path] = None,
     event_bus_dir: Optional[Path] = None,
@@ -518,6 +556,8 @@ __all__ = [
     "ComponentHealth",
     "HealthStatus",
     "check_health",
+    "get_component_checks",
+    "summarize_health",
     "check_database_health",
     "check_eventbus_health",
     "check_filesystem_health",
@@ -335,6 +335,9 @@ def get_metrics_registry() -> CollectorRegistry:
 def get_metrics_output() -> bytes:
     """Get Prometheus-formatted metrics output.
 
+    The registry is rendered straight to UTF-8 bytes, so HTTP handlers can
+    pass the result to a response body without decoding or re-encoding.
+
     Returns:
         Bytes containing Prometheus-formatted metrics
 
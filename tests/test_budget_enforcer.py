@@ -0,0 +1,93 @@
+"""
+Tests for the micro-USD budget ledger in BudgetEnforcer.
+"""
+from decimal import Decimal
+
+import pytest
+
+from adws.cost import Budget, BudgetEnforcer, BudgetPeriod
+from adws.cost.budget import BudgetExceededError
+
+
+def _enforcer(max_cost_usd: float = 1.0) -> BudgetEnforcer:
+    """Enforcer with an enabled per-workflow budget."""
+    return BudgetEnforcer(
+        Budget(max_cost_usd=max_cost_usd, period=BudgetPeriod.PER_WORKFLOW, enabled=True)
+    )
+
+
+@pytest.mark.unit
+def test_ledger_sums_increments_exactly():
+    """Many small increments add up without float drift."""
+    enforcer = _enforcer()
+    for _ in range(9):
+        enforcer.enforce_budget("wf", cost_increment=0.1)
+
+    status = enforcer.get_status("wf")
+    assert status.current_cost == Decimal("0.9")
+    assert status.remaining == Decimal("0.1")
+    assert not status.exceeded
+
+
+@pytest.mark.unit
+def test_exceeding_budget_raises_and_leaves_ledger_unchanged():
+    """An increment that would exceed the budget is rejected, not recorded."""
+    enforcer = _enforcer()
+    enforcer.enforce_budget("wf", cost_increment=0.75)
+
+    with pytest.raises(BudgetExceededError) as excinfo:
+        enforcer.enforce_budget("wf", cost_increment=0.5)
+
+    assert excinfo.value.budget_status.exceeded
+    assert enforcer.get_status("wf").current_cost == Decimal("0.75")
+
+
+@pytest.mark.unit
+def test_enforce_budget_many_matches_sequential_calls():
+    """A batch lands on the same total as the equivalent single calls."""
+    increments = [0.000_000_4, 0.05, 0.12, 0.03]
+    batched = _enforcer()
+    sequential = _enforcer()
+
+    batched.enforce_budget_many("wf", increments)
+    for increment in increments:
+        sequential.enforce_budget("wf", cost_increment=increment)
+
+    assert batched.get_status("wf").current_cost == sequential.get_status("wf").current_cost
+
+
+@pytest.mark.unit
+def test_warning_threshold_uses_integer_limit():
+    """The warning fires exactly at max * warning_threshold."""
+    enforcer = _enforcer()
+
+    assert not enforcer.enforce_budget("wf", cost_increment=0.79).warning
+    assert enforcer.enforce_budget("wf", cost_increment=0.01).warning
+
+
+@pytest.mark.unit
+def test_setting_budget_replaces_limits():
+    """Assigning a budget applies its limits; None disables enforcement."""
+    enforcer = BudgetEnforcer(None)
+    assert enforcer.enforce_budget("wf", cost_increment=5.0).max_cost > Decimal("1000")
+
+    enforcer.budget = Budget(max_cost_usd=2.0, period=BudgetPeriod.TOTAL, enabled=True)
+    status = enforcer.enforce_budget("wf", cost_increment=1.5)
+    assert status.max_cost == Decimal("2")
+    assert status.remaining == Decimal("0.5")
+    assert not enforcer.can_afford("wf", additional_cost=0.6)
+
+    enforcer.budget = None
+    assert not enforcer.is_enabled()
+    assert enforcer.can_afford("wf", additional_cost=100.0)
+
+
+@pytest.mark.unit
+def test_disabled_status_is_not_shared():
+    """Mutating one disabled status does not affect later ones."""
+    enforcer = BudgetEnforcer(None)
+    status = enforcer.check_budget("a")
+    status.current_cost = Decimal("5")
+
+    assert enforcer.check_budget("b").current_cost == Decimal("0")
+    assert enforcer.get_status("c").current_cost == Decimal("0")
@@ -0,0 +1,76 @@
+"""
+Tests for the running cost aggregates in CostTracker.
+"""
+import pytest
+
+from adws.cost import CostTracker
+
+
+def _record(tracker: CostTracker, adw_id: str, provider: str, cost_usd: float, success: bool = True):
+    """Record a call with fixed token counts."""
+    return tracker.record_cost(
+        adw_id=adw_id,
+        provider=provider,
+        model=f"{provider}-model",
+        cost_usd=cost_usd,
+        input_tokens=10,
+        output_tokens=20,
+        slash_command="/implement",
+        success=success,
+    )
+
+
+@pytest.mark.unit
+def test_totals_do_not_drift():
+    """Costs are summed in integer micro-USD."""
+    tracker = CostTracker()
+    for _ in range(10):
+        _record(tracker, "wf", "claude", 0.1)
+
+    report = tracker.get_report("wf")
+    assert report.total_cost == 1.0
+    assert report.total_tokens == 300
+    assert report.call_count == 10
+
+
+@pytest.mark.unit
+def test_report_breakdowns_and_failures():
+    """Per-provider and per-model totals, and failure counts, are tracked."""
+    tracker = CostTracker()
+    _record(tracker, "wf", "claude", 0.05)
+    _record(tracker, "wf", "openai", 0.02, success=False)
+    _record(tracker, "wf", "claude", 0.03)
+
+    report = tracker.get_report("wf")
+    assert report.by_provider == {"claude": 0.08, "openai": 0.02}
+    assert report.by_model == {"claude-model": 0.08, "openai-model": 0.02}
+    assert report.success_count == 2
+    assert report.failure_count == 1
+    assert report.records == []
+    assert len(tracker.get_report("wf", include_records=True).records) == 3
+
+
+@pytest.mark.unit
+def test_global_report_and_clear_workflow():
+    """The global totals follow per-workflow records and clears."""
+    tracker = CostTracker()
+    _record(tracker, "wf-1", "claude", 0.25)
+    _record(tracker, "wf-2", "claude", 0.5)
+
+    assert tracker.get_report().total_cost == 0.75
+    assert len(tracker.get_report(include_records=True).records) == 2
+
+    tracker.clear_workflow("wf-1")
+    assert tracker.get_workflow_cost("wf-1") == 0
+    assert tracker.get_report().total_cost == 0.5
+    assert tracker.get_workflow_tokens("wf-2") == 30
+
+
+@pytest.mark.unit
+def test_negative_values_rejected():
+    """Negative costs and token counts raise ValueError."""
+    tracker = CostTracker()
+    with pytest.raises(ValueError):
+        _record(tracker, "wf", "claude", -0.01)
+    with pytest.raises(ValueError):
+        tracker.record_cost("wf", "claude", "m", 0.01, -1, 0, "/x")
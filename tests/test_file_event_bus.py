@@ -0,0 +1,97 @@
+"""
+Tests for the batching writer thread of FileEventBus.
+"""
+import threading
+
+import pytest
+
+from adws.events import ADWEvent, EventSeverity, EventType
+from adws.events.backends.file import FileEventBus
+
+
+def _event(adw_id: str, message: str, severity: EventSeverity = EventSeverity.INFO) -> ADWEvent:
+    """Build a minimal event for a workflow."""
+    return ADWEvent(
+        adw_id=adw_id,
+        event_type=EventType.WORKFLOW_STARTED,
+        source="test",
+        severity=severity,
+        message=message,
+    )
+
+
+@pytest.fixture
+def batching_bus(tmp_path):
+    """FileEventBus with a writer thread and a long batch window."""
+    bus = FileEventBus(tmp_path, enable_batching=True, batch_size=50, batch_ms=1000)
+    yield bus
+    bus.close()
+
+
+@pytest.mark.unit
+def test_concurrent_publishers_keep_per_workflow_order(batching_bus):
+    """Each workflow's events are written in the order they were published."""
+    per_thread = 300
+
+    def publish(adw_id: str) -> None:
+        for i in range(per_thread):
+            batching_bus.publish(_event(adw_id, str(i)))
+
+    threads = [
+        threading.Thread(target=publish, args=(f"wf-{n}",)) for n in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batching_bus.sync()
+
+    for n in range(4):
+        messages = [event.message for event in batching_bus.read_events(f"wf-{n}")]
+        assert messages == [str(i) for i in range(per_thread)]
+
+
+@pytest.mark.unit
+def test_sync_makes_queued_events_readable(batching_bus):
+    """sync() waits for the writer, so read_events() sees queued events."""
+    for i in range(3):
+        batching_bus.publish(_event("wf-sync", str(i)))
+
+    batching_bus.sync("wf-sync")
+
+    assert [e.message for e in batching_bus.read_events("wf-sync")] == ["0", "1", "2"]
+
+
+@pytest.mark.unit
+def test_critical_event_on_disk_when_publish_returns(batching_bus, tmp_path):
+    """CRITICAL events bypass the batch window and are written before returning."""
+    batching_bus.publish(_event("wf-crit", "queued"))
+    batching_bus.publish(_event("wf-crit", "boom", EventSeverity.CRITICAL))
+
+    lines = (tmp_path / "wf-crit" / "events.jsonl").read_text().splitlines()
+    assert len(lines) == 2
+    assert '"boom"' in lines[1]
+
+
+@pytest.mark.unit
+def test_close_racing_publish_loses_no_events(tmp_path):
+    """Events published while close() runs are still written."""
+    bus = FileEventBus(tmp_path, enable_batching=True, batch_size=50, batch_ms=1000)
+    published = [0] * 3
+    started = threading.Barrier(len(published) + 1)
+
+    def publish(index: int) -> None:
+        started.wait()
+        for i in range(2000):
+            bus.publish(_event("wf-race", f"{index}-{i}"))
+            published[index] += 1
+
+    threads = [threading.Thread(target=publish, args=(n,)) for n in range(len(published))]
+    for thread in threads:
+        thread.start()
+    started.wait()
+    bus.close()
+    for thread in threads:
+        thread.join()
+
+    assert len(bus.read_events("wf-race")) == sum(published)